@@ -1,3 +1,5 @@
+from grob.core.async_finder import find_async, iter_groups_async
 from grob.core.finder import find
+from grob.core.watcher import watch
 
-__all__ = ("find",)
+__all__ = ("find", "find_async", "iter_groups_async", "watch")
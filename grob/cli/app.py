@@ -17,10 +17,12 @@ import argparse
 import os
 import sys
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
 
 from grob.core.finder import find
-from grob.core.output_writers import write_groups
+from grob.core.output_writers import write_group_events, write_groups
+from grob.core.sources import read_manifest, read_path_list
+from grob.core.watcher import watch
 from grob.types import OnMissing, TagName
 
 _TRUEISH_KEYWORDS = {"true", "yes", "all", "1"}
@@ -38,6 +40,22 @@ def _cast_to_field_list(raw_list: Optional[List[str]], default: bool = False) ->
     return raw_list
 
 
+def _parse_manifest_column(raw_column: str) -> Union[str, int]:
+    return int(raw_column) if raw_column.isdigit() else raw_column
+
+
+def _read_files(args: argparse.Namespace) -> Optional[Iterable[str]]:
+    if args.manifest is not None:
+        return read_manifest(args.manifest, column=args.manifest_column)
+    if args.from_list is None:
+        return None
+    separator = "\0" if args.null else "\n"
+    if args.from_list == "-":
+        return read_path_list(sys.stdin, separator=separator)
+    with open(args.from_list) as stream:
+        return list(read_path_list(stream, separator=separator))
+
+
 def create_parser() -> Callable[..., argparse.Namespace]:
     current_dir = Path(os.getcwd())
     parser = argparse.ArgumentParser(
@@ -59,7 +77,10 @@ def create_parser() -> Callable[..., argparse.Namespace]:
         nargs="?",
         type=Path,
         default=current_dir,
-        help="Root directory where files are located.",
+        help=(
+            "Root directory where files are located. It can also be a zip or tar archive, or a glob-like pattern "
+            "matching several archives (e.g. 'shards/*.zip')."
+        ),
     )
     parser.add_argument(
         "--multiple",
@@ -115,6 +136,145 @@ def create_parser() -> Callable[..., argparse.Namespace]:
             "'{parent}-{name}-{ext}'."
         ),
     )
+    parser.add_argument(
+        "--extra-root",
+        dest="extra_roots",
+        metavar="DIR",
+        type=Path,
+        action="append",
+        default=[],
+        help=(
+            "Additional root directory where files are located. Root directories are walked concurrently, and their "
+            "files are grouped together. Can be passed multiple times."
+        ),
+    )
+    parser.add_argument(
+        "--tag-root",
+        dest="tag_roots",
+        metavar="TAG=DIR",
+        action="append",
+        default=[],
+        help=(
+            "Search TAG in DIR instead of ROOT_DIR, e.g. '--tag-root labels=/mnt/labels'. Can be passed multiple times."
+        ),
+    )
+    parser.add_argument(
+        "--anchored",
+        action="store_true",
+        help=(
+            "Match patterns against the whole path relative to ROOT_DIR, instead of any path suffix. For example, "
+            "'images/*.png' will match 'images/a.png' but not 'data/images/a.png'. This allows grob to only walk the "
+            "directories that patterns can reach."
+        ),
+    )
+    parser.add_argument(
+        "--walk-workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Number of threads listing directories concurrently. Using several threads can speed up the search on "
+            "high-latency filesystems, such as network storage. Default to 1."
+        ),
+    )
+    parser.add_argument(
+        "--follow-symlinks",
+        action="store_true",
+        help=(
+            "Walk symbolic links to directories. Each physical directory is only walked once, so that symbolic link "
+            "loops are harmless."
+        ),
+    )
+    parser.add_argument(
+        "--skip-duplicate-files",
+        action="store_true",
+        help="Only keep the first path to each physical file, i.e. skip hard links and symbolic links to known files.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help=(
+            "Cache directory listings in DIR. On subsequent runs over the same ROOT_DIR, only directories modified "
+            "since the previous run are listed again."
+        ),
+    )
+    walk_options = parser.add_argument_group(
+        title="Exclusion rules", description="Controls which files and directories are skipped while walking ROOT_DIR."
+    )
+    walk_options.add_argument(
+        "--exclude",
+        metavar="GLOB",
+        action="append",
+        default=[],
+        help=(
+            "Skip files and directories matching GLOB, using the gitignore syntax (e.g. '.git/' or '*.tmp'). Excluded "
+            "directories are never walked. Can be passed multiple times."
+        ),
+    )
+    walk_options.add_argument(
+        "--ignore-file",
+        dest="ignore_files",
+        metavar="FILE",
+        type=Path,
+        action="append",
+        default=[],
+        help="Skip files and directories matching the patterns in FILE, using the gitignore syntax.",
+    )
+    walk_options.add_argument(
+        "--skip-hidden",
+        action="store_true",
+        help="Skip hidden files and directories, i.e. whose name starts with a dot.",
+    )
+    sources = parser.add_argument_group(
+        title="File sources",
+        description=(
+            "Group the files listed in a path list or a manifest, instead of walking ROOT_DIR. Relative paths are "
+            "relative to ROOT_DIR. The filesystem is never accessed, and exclusion rules are ignored."
+        ),
+    )
+    source = sources.add_mutually_exclusive_group()
+    source.add_argument(
+        "--from-list",
+        metavar="FILE",
+        default=None,
+        help="Read paths from FILE, one per line. Use '-' to read from stdin, e.g. `find . -type f | grob ...`.",
+    )
+    source.add_argument(
+        "--manifest",
+        metavar="FILE",
+        type=Path,
+        default=None,
+        help=(
+            "Read paths from a CSV, TSV or JSON Lines manifest (`.csv`, `.tsv`, `.jsonl` or `.ndjson`, optionally "
+            "gzipped), such as a storage inventory."
+        ),
+    )
+    sources.add_argument(
+        "--null",
+        "-0",
+        action="store_true",
+        help="Paths from --from-list are separated by NUL characters instead of newlines, e.g. `find -print0`.",
+    )
+    sources.add_argument(
+        "--manifest-column",
+        metavar="COLUMN",
+        type=_parse_manifest_column,
+        default="path",
+        help=(
+            "Name of the column (or JSON field) of the manifest containing the paths. For CSV files without header, "
+            "use the index of the column instead. Default to 'path'."
+        ),
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "After the initial search, keep watching ROOT_DIR and output a JSON line each time a group is added, "
+            "completed, changed or removed. Output format options are ignored."
+        ),
+    )
     parser.add_argument(
         "--output",
         "-o",
@@ -253,6 +413,9 @@ def prepare_args(args: argparse.Namespace) -> Dict[TagName, Dict[str, Any]]:
     else:
         for tag_name in args.multiple_allowed:
             tag_specs[tag_name]["allow_multiple"] = True
+    for tag_root in args.tag_roots:
+        tag_name, _, tag_root_dir = tag_root.partition("=")
+        tag_specs[TagName(tag_name.strip())]["root"] = Path(tag_root_dir.strip())
     for attr, value in [
         ("optional_tags", OnMissing.ignore),
         ("remove_on_missing", OnMissing.skip),
@@ -271,14 +434,35 @@ def main() -> None:
     arg_parser = create_parser()
     args = arg_parser()
     tag_specs = prepare_args(args)
+    if args.watch:
+        events = watch(
+            patterns=tag_specs,  # type: ignore[arg-type]
+            root_dir=args.root_dir,
+            key_formatter=args.key_formatter,
+            squeeze=args.squeeze,
+            use_relative_paths=args.use_relative_path,
+            anchored=args.anchored,
+        )
+        write_group_events(events, stream=args.output)
+        return
     groups = find(
         patterns=tag_specs,  # type: ignore[arg-type]
-        root_dir=args.root_dir,
+        root_dir=[args.root_dir, *args.extra_roots],
         key_formatter=args.key_formatter,
         squeeze=args.squeeze,
         use_relative_paths=args.use_relative_path,
         with_keys=args.with_keys,
         compress_to_list=args.compress_to_list,
+        anchored=args.anchored,
+        walk_workers=args.walk_workers,
+        cache_dir=args.cache_dir,
+        follow_symlinks=args.follow_symlinks,
+        skip_duplicate_files=args.skip_duplicate_files,
+        exclude=args.exclude,
+        ignore_files=args.ignore_files,
+        skip_hidden=args.skip_hidden,
+        files=_read_files(args),
+        as_strings=True,
     )
     write_groups(groups, stream=args.output, output_format=args.output_format, tag_names=list(tag_specs))
 
@@ -0,0 +1,67 @@
+import os
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from grob.core.errors import UnsupportedArchiveError
+from grob.core.ignore_rules import IgnoreRules
+from grob.types import FilePath
+
+
+def iter_archive_files(
+    archive: Path, ignore_rules: Optional[IgnoreRules] = None, as_strings: bool = False
+) -> Iterator[FilePath]:
+    """Iterate over the files contained in a zip or tar archive, without extracting them.
+
+    Members are yielded as if the archive was a directory, e.g. member `images/a.png` of `/data/shard.zip` is yielded
+    as `/data/shard.zip/images/a.png`, so that they can be matched and made relative to the archive like regular files.
+
+    Only the index of zip archives is read. Tar archives don't have an index: member headers are read one by one, but
+    their content is skipped. For compressed tar archives (e.g. `.tar.gz`), the whole archive must be decompressed.
+
+    Args:
+        archive: path to a zip or tar archive, possibly compressed
+        ignore_rules: if provided, skip members matching these rules, or located in a directory matching them
+        as_strings: if True, yield paths as strings instead of `Path` objects
+
+    Yields:
+        paths to the files in the archive
+
+    Raises:
+        UnsupportedArchiveError: if `archive` is neither a zip nor a tar archive
+    """
+    if zipfile.is_zipfile(archive):
+        member_names = _list_zip_members(archive)
+    elif tarfile.is_tarfile(archive):
+        member_names = _list_tar_members(archive)
+    else:
+        raise UnsupportedArchiveError(archive)
+    prefix = os.path.join(archive, "")
+    for member_name in member_names:
+        if ignore_rules is not None and ignore_rules.is_file_ignored(member_name):
+            continue
+        yield prefix + member_name if as_strings else archive / member_name
+
+
+def _list_zip_members(archive: Union[str, Path]) -> Iterator[str]:
+    with zipfile.ZipFile(archive) as zip_file:
+        for info in zip_file.infolist():
+            if not info.is_dir():
+                yield _normalize_member_name(info.filename)
+
+
+def _list_tar_members(archive: Union[str, Path]) -> Iterator[str]:
+    with tarfile.open(archive, mode="r:*") as tar_file:
+        while (info := tar_file.next()) is not None:
+            if info.isfile():
+                yield _normalize_member_name(info.name)
+            # Don't keep the headers of all members in memory
+            tar_file.members.clear()
+
+
+def _normalize_member_name(name: str) -> str:
+    # Archives created with e.g. `tar -C dir .` have members named `./a/b.txt`
+    while name.startswith("./"):
+        name = name[2:]
+    return name.lstrip("/")
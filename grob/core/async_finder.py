@@ -0,0 +1,78 @@
+import asyncio
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, Union
+
+from grob.core.finder import _find
+from grob.core.output_formatters import FormattedGroup, FormattedGroups
+from grob.types import GroupKey, TagSpec
+
+MAX_CONCURRENT_SEARCHES = 4
+"""Maximum number of searches running at the same time on the default executor. Extra searches wait in a queue."""
+
+_default_executor: Optional[ThreadPoolExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+async def find_async(
+    patterns: Union[TagSpec, Dict[str, TagSpec]],
+    root_dir: Union[str, Path],
+    *,
+    executor: Optional[Executor] = None,
+    **options: Any,
+) -> FormattedGroups:
+    """Find and group files together without blocking the event loop.
+
+    The search runs on a thread pool shared by all calls, which bounds the number of concurrent searches to
+    `MAX_CONCURRENT_SEARCHES`. Cancelling the calling task stops the search: a queued search never starts, and a running
+    search stops walking the root directory.
+
+    Args:
+        patterns: describes how to find and group files, see `find`
+        root_dir: where to look for files
+        executor: where to run the search. By default, use a thread pool shared by all calls to `find_async`
+        **options: any other argument accepted by `find`
+
+    Returns:
+        files matching `patterns`, grouped by common keys and tags
+    """
+    loop = asyncio.get_running_loop()
+    cancel_event = threading.Event()
+    search = partial(_find, patterns, root_dir, cancel_event=cancel_event, **options)
+    try:
+        return await loop.run_in_executor(executor or _get_default_executor(), search)
+    except asyncio.CancelledError:
+        cancel_event.set()
+        raise
+
+
+async def iter_groups_async(
+    patterns: Union[TagSpec, Dict[str, TagSpec]],
+    root_dir: Union[str, Path],
+    *,
+    executor: Optional[Executor] = None,
+    **options: Any,
+) -> AsyncIterator[Tuple[GroupKey, FormattedGroup]]:
+    """Asynchronously iterate over groups of files, without blocking the event loop.
+
+    Arguments are the same as `find_async`, except for `with_keys` which isn't supported: groups are always yielded
+    along with their key.
+
+    Yields:
+        pairs of group keys and groups, sorted by key
+    """
+    groups = await find_async(patterns, root_dir, executor=executor, **{**options, "with_keys": True})
+    for key, group in groups.items():  # type: ignore[union-attr]
+        yield key, group
+
+
+def _get_default_executor() -> ThreadPoolExecutor:
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(
+                max_workers=MAX_CONCURRENT_SEARCHES, thread_name_prefix="grob-find-async"
+            )
+        return _default_executor
@@ -108,3 +108,31 @@ class InvalidFlagError(GrobError):
             """
         )
         super().__init__(message)
+
+
+class SearchCancelledError(GrobError):
+    def __init__(self) -> None:
+        super().__init__("The search was cancelled before completion.")
+
+
+class InvalidManifestError(GrobError):
+    def __init__(self, manifest: Path) -> None:
+        message = (
+            f"Unsupported manifest format for '{manifest}'. Manifests must be CSV, TSV or JSON Lines files, with "
+            "extension `.csv`, `.tsv`, `.jsonl` or `.ndjson`, optionally compressed with gzip (e.g. `.csv.gz`)."
+        )
+        super().__init__(message)
+
+
+class NoRootDirectoryError(GrobError):
+    def __init__(self) -> None:
+        super().__init__("At least one root directory must be provided.")
+
+
+class UnsupportedArchiveError(GrobError):
+    def __init__(self, archive: Path) -> None:
+        message = (
+            f"Root '{archive}' is a file, but neither a zip nor a tar archive. Root directories must be either "
+            "directories or archives."
+        )
+        super().__init__(message)
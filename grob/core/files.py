@@ -1,23 +1,29 @@
 import dataclasses
-from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Tuple, Union
 
 from grob.core.errors import AmbiguousTagError
 from grob.core.frozendict import frozendict
+from grob.core.matchers import TagMatcher
 from grob.core.parsers import MultiPartKey
 from grob.core.tags import DistributableTag, MultiPartTag, Tag
-from grob.types import Group, GroupKey, KeyPart
+from grob.types import FilePath, Group, GroupKey, KeyPart
 
 
 @dataclasses.dataclass
 class FileCollection:
     tag: Tag
-    files: Dict[Union[GroupKey, MultiPartKey], Union[Path, List[Path]]] = dataclasses.field(default_factory=dict)
+    files: Dict[Union[GroupKey, MultiPartKey], Union[FilePath, List[FilePath]]] = dataclasses.field(
+        default_factory=dict
+    )
 
-    def add_if_matches(self, file: Path) -> bool:
+    def add_if_matches(self, file: FilePath) -> bool:
         key = self.tag.parser(file)
         if key is None:
             return False
+        self.add(file, key)
+        return True
+
+    def add(self, file: FilePath, key: Union[GroupKey, MultiPartKey]) -> None:
         if self.tag.allow_multiple:
             # Typing this properly would require overloading (values are lists if `allow_multiple`, paths otherwise)
             self.files.setdefault(key, []).append(file)  # type: ignore[union-attr]
@@ -25,10 +31,9 @@ class FileCollection:
             self.files[key] = file
         else:
             raise AmbiguousTagError(file, self.files[key], key=key, tag_name=self.tag.name)  # type: ignore[arg-type]
-        return True
 
 
-def find_by_tag(files: Iterable[Path], tags: List[Tag]) -> List[FileCollection]:
+def find_by_tag(files: Iterable[FilePath], tags: List[Tag]) -> List[FileCollection]:
     """Find all files matching one of the provided tags.
 
     Args:
@@ -41,11 +46,12 @@ def find_by_tag(files: Iterable[Path], tags: List[Tag]) -> List[FileCollection]:
             matters: most specific tags should come first.
     """
     file_collections = [FileCollection(tag=tag) for tag in tags]
+    match_tag = TagMatcher(tags)
     for file in files:
-        for collection in file_collections:
-            added = collection.add_if_matches(file)
-            if added:
-                break
+        match = match_tag(file)
+        if match is not None:
+            index, key = match
+            file_collections[index].add(file, key)
     return file_collections
 
 
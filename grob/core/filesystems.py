@@ -0,0 +1,125 @@
+import bisect
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Protocol, Tuple
+
+from grob.core.walker import list_dir
+
+ObjectListingPage = Tuple[List[str], List[str]]
+"""A page of an object listing: object keys, then common prefixes (i.e. "subdirectories", with a trailing delimiter)."""
+
+
+class FileSystem(Protocol):
+    """A filesystem that can be searched with `find`.
+
+    Paths are POSIX-like strings. Implementations can also provide a `list_tree(dir_path)` method, returning the paths
+    of all files below a directory at once: it is then used to list directories that must be walked recursively.
+    """
+
+    def list_dir(self, dir_path: str) -> Tuple[List[str], List[str]]:
+        """Return the paths of files and subdirectories located directly in `dir_path`."""
+
+
+class ObjectStoreClient(Protocol):
+    """Minimal client of an object store, such as S3 or GCS."""
+
+    def list_objects(self, bucket: str, prefix: str, delimiter: Optional[str] = None) -> Iterable[ObjectListingPage]:
+        """List objects whose key starts with `prefix`, one page at a time.
+
+        If `delimiter` is provided, keys containing the delimiter after the prefix aren't returned. Instead, their
+        common prefixes, up to the first delimiter, are returned once, like S3's `ListObjectsV2`.
+        """
+
+
+class LocalFileSystem:
+    """The local filesystem. This is the default filesystem of `find`."""
+
+    def list_dir(self, dir_path: str) -> Tuple[List[str], List[str]]:
+        return list_dir(dir_path)
+
+
+class ObjectStoreFileSystem:
+    """An object store, seen as a filesystem.
+
+    Paths are `/<bucket>/<key>`, e.g. `find(..., root_dir="/my-bucket/datasets/train", filesystem=...)`. Directories
+    are emulated with delimited listings: listing `/my-bucket/datasets` lists keys starting with `datasets/`, without
+    descending into "subdirectories". Combined with anchored patterns, only the prefixes that tags can reach are
+    listed, which saves listing requests on large buckets.
+    """
+
+    def __init__(self, client: ObjectStoreClient, delimiter: str = "/") -> None:
+        self.client = client
+        self.delimiter = delimiter
+
+    def list_dir(self, dir_path: str) -> Tuple[List[str], List[str]]:
+        bucket, prefix = self._split_path(dir_path)
+        file_paths = []
+        sub_dirs = []
+        for keys, common_prefixes in self.client.list_objects(bucket, prefix=prefix, delimiter=self.delimiter):
+            # Keys ending with the delimiter are "directory markers" created by some tools
+            file_paths.extend(f"/{bucket}/{key}" for key in keys if not key.endswith(self.delimiter))
+            sub_dirs.extend(f"/{bucket}/{common_prefix[: -len(self.delimiter)]}" for common_prefix in common_prefixes)
+        return file_paths, sub_dirs
+
+    def list_tree(self, dir_path: str) -> Iterator[str]:
+        bucket, prefix = self._split_path(dir_path)
+        for keys, _ in self.client.list_objects(bucket, prefix=prefix):
+            yield from (f"/{bucket}/{key}" for key in keys if not key.endswith(self.delimiter))
+
+    def _split_path(self, dir_path: str) -> Tuple[str, str]:
+        bucket, _, prefix = dir_path.strip("/").partition("/")
+        return bucket, prefix + self.delimiter if prefix else ""
+
+
+class S3Client:
+    """Adapt a `boto3` S3 client to the `ObjectStoreClient` protocol, e.g. `S3Client(boto3.client("s3"))`."""
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    def list_objects(self, bucket: str, prefix: str, delimiter: Optional[str] = None) -> Iterator[ObjectListingPage]:
+        arguments = {"Bucket": bucket, "Prefix": prefix}
+        if delimiter is not None:
+            arguments["Delimiter"] = delimiter
+        for page in self.client.get_paginator("list_objects_v2").paginate(**arguments):
+            keys = [content["Key"] for content in page.get("Contents", [])]
+            common_prefixes = [common_prefix["Prefix"] for common_prefix in page.get("CommonPrefixes", [])]
+            yield keys, common_prefixes
+
+
+class InMemoryObjectStore:
+    """An in-memory object store, mostly useful for testing.
+
+    Listings are paginated like S3: each page contains at most `page_size` keys and common prefixes. The number of
+    listing requests is counted in `requests`.
+    """
+
+    def __init__(self, keys_by_bucket: Mapping[str, Iterable[str]], page_size: int = 1000) -> None:
+        self.keys_by_bucket: Dict[str, List[str]] = {bucket: sorted(keys) for bucket, keys in keys_by_bucket.items()}
+        self.page_size = page_size
+        self.requests = 0
+
+    def list_objects(self, bucket: str, prefix: str, delimiter: Optional[str] = None) -> Iterator[ObjectListingPage]:
+        keys = self.keys_by_bucket.get(bucket, [])
+        page: ObjectListingPage = ([], [])
+        last_common_prefix = None
+        pages = 0
+        for index in range(bisect.bisect_left(keys, prefix), len(keys)):
+            key = keys[index]
+            if not key.startswith(prefix):
+                break
+            end = key.find(delimiter, len(prefix)) if delimiter else -1
+            if end == -1:
+                page[0].append(key)
+            elif (common_prefix := key[: end + len(delimiter)]) != last_common_prefix:  # type: ignore[arg-type]
+                # Keys are sorted, so keys sharing the same common prefix are contiguous
+                page[1].append(common_prefix)
+                last_common_prefix = common_prefix
+            else:
+                continue
+            if len(page[0]) + len(page[1]) == self.page_size:
+                pages += 1
+                self.requests += 1
+                yield page
+                page = ([], [])
+        if page != ([], []) or pages == 0:
+            self.requests += 1
+            yield page
@@ -1,24 +1,50 @@
+import functools
+import glob
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
-from grob.core.files import find_by_tag, group_by_key
+from grob.core.archives import iter_archive_files
+from grob.core.errors import NoRootDirectoryError, SearchCancelledError
+from grob.core.files import FileCollection, find_by_tag, group_by_key
+from grob.core.filesystems import FileSystem, LocalFileSystem
 from grob.core.group_validation import filter_and_validate_groups
+from grob.core.ignore_rules import IgnoreRules
 from grob.core.key_formatters import get_key_formatter
+from grob.core.listing_cache import ListingCache
 from grob.core.output_formatters import FormattedGroups, format_groups
 from grob.core.parsers import AnonymousParser, MultiPartKey
+from grob.core.search_plan import create_search_plan
 from grob.core.tags import Tag, create_tags
 from grob.core.walker import walk
-from grob.types import GroupKey, TagSpec
+from grob.types import FilePath, GroupKey, TagSpec
+
+RootDir = Union[str, Path]
+_GLOB_CHARACTERS = re.compile(r"[*?[]")
 
 
 def find(
     patterns: Union[TagSpec, Dict[str, TagSpec]],
-    root_dir: Union[str, Path],
+    root_dir: Union[RootDir, Sequence[RootDir]],
     key_formatter: Union[str, Callable[[MultiPartKey], GroupKey], None] = None,
     use_relative_paths: bool = False,
     squeeze: bool = True,
     with_keys: Optional[bool] = None,
     compress_to_list: bool = True,
+    anchored: bool = False,
+    walk_workers: int = 1,
+    cache_dir: Union[str, Path, None] = None,
+    exclude: Sequence[str] = (),
+    ignore_files: Sequence[Union[str, Path]] = (),
+    skip_hidden: bool = False,
+    files: Optional[Iterable[Union[str, Path]]] = None,
+    as_strings: bool = False,
+    filesystem: Optional[FileSystem] = None,
+    follow_symlinks: bool = False,
+    skip_duplicate_files: bool = False,
 ) -> FormattedGroups:
     """Find and group files together using glob-like patterns.
 
@@ -40,44 +66,276 @@ def find(
         }
     }
     ```
-    will create two tags `image` and `legend`, the latter being optional and accepting multiple files.
+    will create two tags `image` and `legend`, the latter being optional and accepting multiple files. A tag can also be
+    searched in its own directory with the `root` option (e.g. `{"spec": "{name}.json", "root": "/mnt/labels"}`),
+    instead of `root_dir`.
 
     Args:
         patterns: describes how to find and group files. It can be a single pattern (in which case a tag with a default
             name will be created) or a mapping from tag names to patterns. For tag-specific options (i.e. indicate what
             to do if a tag is missing from a group), a mapping from tag names to tag options can be provided
-        root_dir: where to look for files. `root_dir` will be walked recursively
+        root_dir: where to look for files. `root_dir` will be walked recursively. Several root directories can be
+            provided, e.g. when files are spread across different volumes: they are walked concurrently, and their files
+            are grouped together. Zip and tar archives are searched without being extracted, as if they were
+            directories. Glob-like roots such as `shards/*.zip` are expanded
         key_formatter: specify how to format keys. By default, all key parts (such as `year` or `index` in the example
             above) are concatenated with underscores. `key_formatter` can be either a f-string or a function that takes
             a dictionary of parts (e.g. `{"year": 2020, "index": 1}`) and returns a string
-        use_relative_paths: if True, return paths relative to `root_dir`. Otherwise, return absolute paths
+        use_relative_paths: if True, return paths relative to the root directory where they were found. Otherwise,
+            return absolute paths
         squeeze: if True, the output will be squeezed when possible (i.e. tag will be omitted from the output if it is
             not ambiguous)
         with_keys: whether to include the group keys in the output
         compress_to_list: if True, the value of `with_keys` will be automatically set from `patterns`. Ignored if
             `with_keys` is passed
+        anchored: if True, glob-like patterns must match the whole path relative to `root_dir`, instead of any path
+            suffix. This allows `grob` to only walk the directories that patterns can reach
+        walk_workers: number of threads listing directories concurrently. Using several threads can speed up the
+            search on high-latency filesystems, such as network storage
+        cache_dir: if provided, directory listings are cached in this directory. On subsequent searches in the same
+            root directory, only directories that were modified since the previous search are listed again
+        exclude: files and directories to skip, using the gitignore syntax (e.g. `.git/` or `*.tmp`). Patterns are
+            relative to `root_dir`. Excluded directories are never walked
+        ignore_files: files containing patterns to exclude, using the gitignore syntax
+        skip_hidden: if True, skip hidden files and directories (i.e. whose name starts with a dot)
+        files: if provided, group these files instead of walking `root_dir`, e.g. paths read from a file inventory.
+            Relative paths are relative to `root_dir`. The filesystem is never accessed, and options controlling the
+            walk are ignored
+        as_strings: if True, return paths as strings instead of `Path` objects. Files are then never converted to
+            `Path` objects, which makes searches over millions of files much faster and lighter on memory. Callable
+            tag specs still receive `Path` objects
+        filesystem: where to look for files, e.g. an `ObjectStoreFileSystem` to search a bucket. By default, search the
+            local filesystem. Listing caches and archives are only supported on the local filesystem
+        follow_symlinks: if True, walk symbolic links to directories. Each physical directory is only walked once,
+            from the first path leading to it, so that symbolic link loops are harmless
+        skip_duplicate_files: if True, only keep the first path to each physical file, i.e. skip hard links and
+            symbolic links to files that were already found
 
     Returns:
         files matching `patterns`, grouped by common keys and tags
     """
-    root_dir = Path(root_dir)
-    root_dir = root_dir.resolve()
-    tags = create_tags(patterns)
+    return _find(
+        patterns,
+        root_dir,
+        key_formatter=key_formatter,
+        use_relative_paths=use_relative_paths,
+        squeeze=squeeze,
+        with_keys=with_keys,
+        compress_to_list=compress_to_list,
+        anchored=anchored,
+        walk_workers=walk_workers,
+        cache_dir=cache_dir,
+        exclude=exclude,
+        ignore_files=ignore_files,
+        skip_hidden=skip_hidden,
+        files=files,
+        as_strings=as_strings,
+        filesystem=filesystem,
+        follow_symlinks=follow_symlinks,
+        skip_duplicate_files=skip_duplicate_files,
+    )
+
+
+def _find(
+    patterns: Union[TagSpec, Dict[str, TagSpec]],
+    root_dir: Union[RootDir, Sequence[RootDir]],
+    key_formatter: Union[str, Callable[[MultiPartKey], GroupKey], None] = None,
+    use_relative_paths: bool = False,
+    squeeze: bool = True,
+    with_keys: Optional[bool] = None,
+    compress_to_list: bool = True,
+    anchored: bool = False,
+    walk_workers: int = 1,
+    cache_dir: Union[str, Path, None] = None,
+    exclude: Sequence[str] = (),
+    ignore_files: Sequence[Union[str, Path]] = (),
+    skip_hidden: bool = False,
+    files: Optional[Iterable[Union[str, Path]]] = None,
+    as_strings: bool = False,
+    filesystem: Optional[FileSystem] = None,
+    follow_symlinks: bool = False,
+    skip_duplicate_files: bool = False,
+    cancel_event: Optional[threading.Event] = None,
+) -> FormattedGroups:
+    # Same as `find`, but the search stops as soon as `cancel_event` is set
+    if isinstance(filesystem, LocalFileSystem):
+        filesystem = None
+    root_dirs = _resolve_root_dirs(root_dir, is_local=filesystem is None)
+    tags = create_tags(patterns, anchor=root_dirs[0].as_posix() if anchored else None)
     with_keys = _update_with_keys(with_keys, allow_auto_keys=compress_to_list, tags=tags)
     key_formatter = get_key_formatter(key_formatter, tags=tags)
-    files = walk(root_dir)
-    files_by_tag = find_by_tag(files, tags)
+    tags_by_root = _assign_tags_to_root_dirs(patterns, tags, root_dirs=root_dirs, anchored=anchored)
+    files_by_root: Dict[Path, Iterable[FilePath]] = {}
+    if files is not None:
+        files_by_root = _dispatch_files(files, root_dirs[0], roots=list(tags_by_root), as_strings=as_strings)
+    ignore_rules = IgnoreRules.from_options(exclude, ignore_files=ignore_files, skip_hidden=skip_hidden)
+    searches = [
+        functools.partial(
+            _search_root_dir,
+            root,
+            tags=[tag for _, tag in indexed_tags],
+            files=files_by_root.get(root) if files is not None else None,
+            walk_workers=walk_workers,
+            cache_dir=cache_dir,
+            ignore_rules=ignore_rules,
+            as_strings=as_strings,
+            filesystem=filesystem,
+            follow_symlinks=follow_symlinks,
+            skip_duplicate_files=skip_duplicate_files,
+            cancel_event=cancel_event,
+        )
+        for root, indexed_tags in tags_by_root.items()
+    ]
+    if len(searches) == 1:
+        collections_by_root = [searches[0]()]
+    else:
+        with ThreadPoolExecutor(max_workers=max(len(searches), 1), thread_name_prefix="grob-root") as executor:
+            futures = [executor.submit(search) for search in searches]
+            collections_by_root = [future.result() for future in futures]
+    files_by_tag = _merge_collections(tags, list(tags_by_root.values()), collections_by_root)
     groups = group_by_key(files_by_tag, key_formatter=key_formatter)
     groups = filter_and_validate_groups(groups, tags=tags)
     return format_groups(
         groups,
         tag_names=[tag.name for tag in tags],
-        relative_to=root_dir if use_relative_paths else None,
+        relative_to=[*root_dirs, *tags_by_root] if use_relative_paths else None,
         squeeze=squeeze,
         with_keys=with_keys,
     )
 
 
+def _resolve_root_dirs(root_dir: Union[RootDir, Sequence[RootDir]], is_local: bool) -> List[Path]:
+    raw_root_dirs = [root_dir] if isinstance(root_dir, (str, Path)) else root_dir
+    if not is_local:
+        # Paths on other filesystems can't be resolved nor expanded
+        root_dirs = list({Path(raw_root_dir): None for raw_root_dir in raw_root_dirs})
+        if not root_dirs:
+            raise NoRootDirectoryError()
+        return root_dirs
+    expanded_root_dirs = []
+    for raw_root_dir in raw_root_dirs:
+        # Expand glob-like roots, e.g. `shards/*.zip`, unless they actually exist
+        if _GLOB_CHARACTERS.search(os.fspath(raw_root_dir)) and not os.path.exists(raw_root_dir):
+            expanded_root_dirs.extend(sorted(glob.glob(os.fspath(raw_root_dir))))
+        else:
+            expanded_root_dirs.append(raw_root_dir)
+    # Use a dict to remove duplicates while preserving order
+    root_dirs = list({Path(raw_root_dir).resolve(): None for raw_root_dir in expanded_root_dirs})
+    if not root_dirs:
+        raise NoRootDirectoryError()
+    return root_dirs
+
+
+def _assign_tags_to_root_dirs(
+    patterns: Union[TagSpec, Dict[str, TagSpec]], tags: List[Tag], root_dirs: List[Path], anchored: bool
+) -> Dict[Path, List[Tuple[int, Tag]]]:
+    # Return, for each directory to walk, the tags to search for and their index in `tags`. Tags with their own root
+    # directory are only searched there, other tags are searched in all root directories
+    tags_by_root: Dict[Path, List[Tuple[int, Tag]]] = {}
+    for root_dir in root_dirs:
+        # Anchored patterns depend on the root directory
+        root_tags = tags
+        if anchored and root_dir != root_dirs[0]:
+            root_tags = create_tags(patterns, anchor=root_dir.as_posix())
+        for index, tag in enumerate(root_tags):
+            if tag.root is None:
+                tags_by_root.setdefault(root_dir, []).append((index, tag))
+    for index, tag in enumerate(tags):
+        if tag.root is not None:
+            tags_by_root.setdefault(tag.root, []).append((index, tag))
+    # Tag order matters, since a file is only added to the first tag it matches
+    return {root_dir: sorted(indexed_tags, key=lambda item: item[0]) for root_dir, indexed_tags in tags_by_root.items()}
+
+
+def _dispatch_files(
+    files: Iterable[Union[str, Path]], root_dir: Path, roots: List[Path], as_strings: bool
+) -> Dict[Path, Iterable[FilePath]]:
+    # Assign each file to the root directories containing it. Files outside of all roots are assigned to `root_dir`
+    to_path: Callable[[Union[str, Path]], FilePath]
+    to_path = functools.partial(os.path.join, root_dir) if as_strings else root_dir.joinpath
+    if roots == [root_dir]:
+        return {root_dir: map(to_path, files)}
+    prefixes = {root: os.path.join(root, "") for root in roots}
+    files_by_root: Dict[Path, List[FilePath]] = {root: [] for root in roots}
+    for file in files:
+        path = to_path(file)
+        for root in [root for root, prefix in prefixes.items() if str(path).startswith(prefix)] or [root_dir]:
+            if root in files_by_root:
+                files_by_root[root].append(path)
+    return files_by_root  # type: ignore[return-value]
+
+
+def _search_root_dir(
+    root_dir: Path,
+    tags: List[Tag],
+    files: Optional[Iterable[FilePath]],
+    walk_workers: int,
+    cache_dir: Union[str, Path, None],
+    ignore_rules: Optional[IgnoreRules],
+    as_strings: bool,
+    filesystem: Optional[FileSystem],
+    follow_symlinks: bool,
+    skip_duplicate_files: bool,
+    cancel_event: Optional[threading.Event],
+) -> List[FileCollection]:
+    listing_cache = None
+    file_paths: Iterable[FilePath]
+    if files is not None:
+        file_paths = files
+    elif filesystem is not None:
+        file_paths = walk(
+            root_dir,
+            search_plan=create_search_plan(tags),
+            workers=walk_workers,
+            lister=filesystem.list_dir,
+            ignore_rules=ignore_rules,
+            as_strings=as_strings,
+            tree_lister=getattr(filesystem, "list_tree", None),
+        )
+    elif root_dir.is_file():
+        file_paths = iter_archive_files(root_dir, ignore_rules=ignore_rules, as_strings=as_strings)
+    else:
+        if cache_dir is not None:
+            listing_cache = ListingCache(Path(cache_dir), root_dir=root_dir, follow_symlinks=follow_symlinks)
+        file_paths = walk(
+            root_dir,
+            search_plan=create_search_plan(tags),
+            workers=walk_workers,
+            lister=listing_cache.list_dir if listing_cache is not None else None,
+            ignore_rules=ignore_rules,
+            as_strings=as_strings,
+            follow_symlinks=follow_symlinks,
+            skip_duplicate_files=skip_duplicate_files,
+        )
+    if cancel_event is not None:
+        file_paths = _stop_on_cancel(file_paths, cancel_event)
+    file_collections = find_by_tag(file_paths, tags)
+    if listing_cache is not None:
+        listing_cache.save()
+    return file_collections
+
+
+def _merge_collections(
+    tags: List[Tag], indexed_tags_by_root: List[List[Tuple[int, Tag]]], collections_by_root: List[List[FileCollection]]
+) -> List[FileCollection]:
+    if len(collections_by_root) == 1 and len(collections_by_root[0]) == len(tags):
+        return collections_by_root[0]
+    merged_collections = [FileCollection(tag=tag) for tag in tags]
+    for indexed_tags, collections in zip(indexed_tags_by_root, collections_by_root):
+        for (index, _), collection in zip(indexed_tags, collections):
+            for key, files in collection.files.items():
+                for file in files if isinstance(files, list) else [files]:
+                    merged_collections[index].add(file, key)
+    return merged_collections
+
+
+def _stop_on_cancel(files: Iterable[FilePath], cancel_event: threading.Event) -> Iterable[FilePath]:
+    for file in files:
+        if cancel_event.is_set():
+            raise SearchCancelledError()
+        yield file
+
+
 def _update_with_keys(with_keys: Optional[bool], allow_auto_keys: bool, tags: List[Tag]) -> bool:
     if with_keys is not None:
         return with_keys
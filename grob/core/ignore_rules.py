@@ -0,0 +1,122 @@
+import dataclasses
+import re
+from pathlib import Path
+from typing import Iterable, List, Optional, Pattern, Sequence, Union
+
+
+@dataclasses.dataclass(frozen=True)
+class IgnoreRule:
+    regex: Pattern
+    negate: bool = False
+    dir_only: bool = False
+
+
+class IgnoreRules:
+    """Decide which files and directories must be skipped while walking.
+
+    Rules use the gitignore syntax, and are matched against paths relative to the root directory:
+
+    - a rule without slash (e.g. `*.pyc` or `__pycache__/`) matches files and directories at any nesting level
+    - a rule with a slash (e.g. `/build` or `data/tmp`) is anchored to the root directory
+    - a rule ending with a slash only matches directories
+    - `**` matches any number of directories, `*` and `?` match anything but a slash
+    - a rule starting with `!` re-includes paths excluded by previous rules. The last matching rule wins
+
+    Excluded directories are never listed, so paths below them can't be re-included.
+    """
+
+    def __init__(self, rules: Sequence[IgnoreRule] = (), skip_hidden: bool = False) -> None:
+        self.rules = list(rules)
+        self.skip_hidden = skip_hidden
+
+    @classmethod
+    def from_options(
+        cls,
+        exclude: Iterable[str] = (),
+        ignore_files: Iterable[Union[str, Path]] = (),
+        skip_hidden: bool = False,
+    ) -> Optional["IgnoreRules"]:
+        """Create rules from glob patterns and ignore files, or return None if nothing must be skipped."""
+        lines = list(exclude)
+        for ignore_file in ignore_files:
+            lines.extend(Path(ignore_file).read_text().splitlines())
+        rules = [rule for rule in map(parse_rule, lines) if rule is not None]
+        if not rules and not skip_hidden:
+            return None
+        return cls(rules, skip_hidden=skip_hidden)
+
+    def is_ignored(self, relative_path: str, is_dir: bool) -> bool:
+        if self.skip_hidden and relative_path.rpartition("/")[2].startswith("."):
+            return True
+        ignored = False
+        for rule in self.rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.fullmatch(relative_path):
+                ignored = not rule.negate
+        return ignored
+
+    def is_file_ignored(self, relative_path: str) -> bool:
+        """Return True if a file, or any of its parent directories, is ignored.
+
+        Useful when files are listed without walking their parent directories, e.g. from an archive index.
+        """
+        *dir_names, _ = relative_path.split("/")
+        for i in range(1, len(dir_names) + 1):
+            if self.is_ignored("/".join(dir_names[:i]), is_dir=True):
+                return True
+        return self.is_ignored(relative_path, is_dir=False)
+
+
+def parse_rule(line: str) -> Optional[IgnoreRule]:
+    """Parse a line of a gitignore file. Return None for blank lines and comments."""
+    line = line.rstrip()
+    if not line or line.startswith("#"):
+        return None
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    elif line.startswith("\\"):
+        # Escaped leading `!` or `#`
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+    anchored = "/" in line
+    regex = _convert_glob_to_regex(line.lstrip("/"))
+    if not anchored:
+        regex = "(?:.*/)?" + regex
+    return IgnoreRule(re.compile(regex), negate=negate, dir_only=dir_only)
+
+
+def _convert_glob_to_regex(glob: str) -> str:
+    parts: List[str] = []
+    i = 0
+    while i < len(glob):
+        char = glob[i]
+        if glob.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+            continue
+        if glob.startswith("**", i):
+            parts.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[" and (end := glob.find("]", i + 2)) != -1:
+            content = glob[i + 1 : end]
+            if content.startswith("!"):
+                content = "^" + content[1:]
+            parts.append("[" + content.replace("\\", "\\\\") + "]")
+            i = end
+        elif char == "\\" and i + 1 < len(glob):
+            i += 1
+            parts.append(re.escape(glob[i]))
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return "".join(parts)
@@ -0,0 +1,82 @@
+"""Minimal binding to the Linux inotify API, based on `ctypes`."""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+from typing import Dict, List, Optional, Tuple
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")
+_BUFFER_SIZE = 64 * 1024
+
+
+class InotifyUnavailableError(OSError):
+    pass
+
+
+class Inotify:
+    """Watch directories for changes using inotify.
+
+    Raises:
+        InotifyUnavailableError: if inotify isn't supported on this platform
+    """
+
+    def __init__(self) -> None:
+        if not sys.platform.startswith("linux"):
+            raise InotifyUnavailableError("inotify is only available on Linux")
+        try:
+            self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError) as error:
+            raise InotifyUnavailableError(str(error)) from error
+        if fd < 0:
+            raise InotifyUnavailableError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd: int = fd
+        self._watched_dirs: Dict[int, str] = {}
+
+    def add_watch(self, dir_path: str) -> None:
+        watch_descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(dir_path), WATCH_MASK)
+        # Failures (e.g. the directory was just removed, or the watch limit is reached) are ignored
+        if watch_descriptor >= 0:
+            self._watched_dirs[watch_descriptor] = dir_path
+
+    def read_events(self, timeout: Optional[float] = None) -> List[Tuple[str, int]]:
+        """Wait for events for at most `timeout` seconds, and return them as `(path, mask)` pairs."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            buffer = os.read(self._fd, _BUFFER_SIZE)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset < len(buffer):
+            watch_descriptor, mask, _, name_length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset : offset + name_length].rstrip(b"\0"))
+            offset += name_length
+            if mask & IN_Q_OVERFLOW:
+                events.append(("", mask))
+                continue
+            dir_path = self._watched_dirs.get(watch_descriptor)
+            if mask & IN_IGNORED:
+                self._watched_dirs.pop(watch_descriptor, None)
+            elif dir_path is not None:
+                events.append((os.path.join(dir_path, name) if name else dir_path, mask))
+        return events
+
+    def close(self) -> None:
+        os.close(self._fd)
@@ -0,0 +1,83 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from grob.core.walker import list_dir
+
+CACHE_VERSION = 1
+RACY_DELAY_NS = 2_000_000_000
+"""Directories modified less than 2 seconds before being listed aren't cached.
+
+Modification times have a limited resolution on some filesystems: an entry added right after the listing could leave
+the modification time of the directory unchanged.
+"""
+
+
+class ListingCache:
+    """On-disk cache of directory listings, revalidated with the modification time of each directory.
+
+    Adding, removing or renaming an entry in a directory updates its modification time. When walking a directory
+    again, only one `stat` call is needed to know if its cached listing is still valid.
+
+    Listings are stored in one JSON file per root directory. Call `save` once the walk is over to persist
+    them.
+
+    If `follow_symlinks` is True, symbolic links to directories are listed as subdirectories. Such listings are stored
+    in a separate file.
+    """
+
+    def __init__(self, cache_dir: Path, root_dir: Path, follow_symlinks: bool = False) -> None:
+        cache_name = root_dir.as_posix() + (":follow-symlinks" if follow_symlinks else "")
+        self.cache_file = Path(cache_dir) / f"{hashlib.sha256(cache_name.encode()).hexdigest()}.json"
+        self.follow_symlinks = follow_symlinks
+        self._listings: Dict[str, List[Any]] = self._load()
+        self.hits = 0
+        self.misses = 0
+
+    def list_dir(self, dir_path: str) -> Tuple[List[str], List[str]]:
+        """Return the paths of files and subdirectories of `dir_path`, using the cached listing if it is still valid."""
+        try:
+            stat = os.stat(dir_path)
+        except OSError:
+            return [], []
+        # Stored as a list, to compare it with values read from JSON
+        signature = [stat.st_mtime_ns, stat.st_ino, stat.st_dev]
+        cached_listing = self._listings.get(dir_path)
+        if cached_listing is not None and cached_listing[0] == signature:
+            self.hits += 1
+            _, file_names, dir_names = cached_listing
+            file_paths = [os.path.join(dir_path, name) for name in file_names]
+            sub_dirs = [os.path.join(dir_path, name) for name in dir_names]
+            return file_paths, sub_dirs
+        self.misses += 1
+        file_paths, sub_dirs = list_dir(dir_path, follow_symlinks=self.follow_symlinks)
+        if time.time_ns() - stat.st_mtime_ns > RACY_DELAY_NS:
+            self._listings[dir_path] = [
+                signature,
+                [os.path.basename(path) for path in file_paths],
+                [os.path.basename(path) for path in sub_dirs],
+            ]
+        else:
+            self._listings.pop(dir_path, None)
+        return file_paths, sub_dirs
+
+    def save(self) -> None:
+        """Atomically write the cache to disk."""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=self.cache_file.parent, suffix=".tmp", delete=False) as stream:
+            json.dump({"version": CACHE_VERSION, "listings": self._listings}, stream)
+        os.replace(stream.name, self.cache_file)
+
+    def _load(self) -> Dict[str, List[Any]]:
+        try:
+            with self.cache_file.open() as stream:
+                content = json.load(stream)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(content, dict) or content.get("version") != CACHE_VERSION:
+            return {}
+        return content["listings"]
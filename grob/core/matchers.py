@@ -0,0 +1,163 @@
+import functools
+import itertools
+import re
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from grob.core.frozendict import frozendict
+from grob.core.parsers import MultiPartKey, Parser, PatternParser
+from grob.core.segments import DirMatch, SegmentPattern
+from grob.core.tags import Tag
+from grob.types import FilePath, GroupKey, KeyPart
+
+# Regex of a pattern starting with `*` or with a plain placeholder, possibly after `**/`, e.g. `**/{name}.png`
+_SEGMENT_WILDCARD_PREFIX = re.compile(r"(?:\(\[\^/\]\+/\)\*)?(?:\[\^/\]\*|\(\?P<\w+>\[\^/\]\+\?\)(?!\?))")
+
+# Below this number of tags, selecting candidate tags costs more than matching all of them
+_MIN_INDEXED_TAGS = 32
+# Maximum number of distinct sets of candidate tags whose matchers are kept
+_MAX_CACHED_CANDIDATES = 1024
+# Maximum number of directories whose matches are kept
+_MAX_CACHED_DIRS = 1024
+
+TagMatch = Tuple[int, Union[GroupKey, MultiPartKey]]
+"""Index of the tag matching a path, and key extracted from this path."""
+
+_Matcher = Callable[[FilePath], Optional[TagMatch]]
+
+
+class TagMatcher:
+    """Find the first tag matching a path, and extract its key.
+
+    Consecutive tags using glob-like patterns are combined into a single regular expression, so that a path is matched
+    against all of them with a single call to the regex engine. Tags are still tried in order: when several tags match
+    a path, the first one wins.
+
+    With many tags, most of them can't match a given path. Glob-like tags are indexed by a literal directory name or
+    extension that their paths must contain, so that only the tags that can match a path are tried.
+    """
+
+    def __init__(self, tags: Sequence[Tag]) -> None:
+        self.tags = list(tags)
+        self._segment_patterns = {
+            index: segment_pattern
+            for index, tag in enumerate(self.tags)
+            if _is_combinable(tag.parser)
+            and (segment_pattern := SegmentPattern.compile(tag.parser.pattern, tag.parser.anchor)) is not None  # type: ignore
+        }
+        self._index = _CandidateIndex(self.tags if len(self.tags) >= _MIN_INDEXED_TAGS else [])
+        # Paths in the same directory, or with the same extension, share the same candidate tags
+        self._get_matchers = functools.lru_cache(maxsize=_MAX_CACHED_CANDIDATES)(self._build_matchers)
+        self._all_matchers = [] if self._index else self._build_matchers(tuple(range(len(self.tags))))
+
+    def __call__(self, path: FilePath) -> Optional[TagMatch]:
+        matchers = self._get_matchers(self._index.candidates(str(path))) if self._index else self._all_matchers
+        for matcher in matchers:
+            match = matcher(path)
+            if match is not None:
+                return match
+        return None
+
+    def _build_matchers(self, candidates: Tuple[int, ...]) -> List[_Matcher]:
+        # Tags that aren't candidates can't match, so candidates separated by other tags can still be combined
+        matchers: List[_Matcher] = []
+        for kind, indices in itertools.groupby(candidates, key=self._get_kind):
+            if kind == "segments":
+                matchers.append(_SegmentPatternMatcher([(index, self._segment_patterns[index]) for index in indices]))
+            elif kind == "regex":
+                parsers = [(index, self.tags[index].parser) for index in indices]
+                if len(parsers) == 1:
+                    matchers.append(_ParserMatcher(*parsers[0]))
+                else:
+                    matchers.append(_CombinedPatternMatcher(parsers))  # type: ignore[arg-type]
+            else:
+                matchers.extend(_ParserMatcher(index, self.tags[index].parser) for index in indices)
+        return matchers
+
+    def _get_kind(self, index: int) -> str:
+        if index in self._segment_patterns:
+            return "segments"
+        return "regex" if _is_combinable(self.tags[index].parser) else "parser"
+
+
+class _ParserMatcher:
+    def __init__(self, index: int, parser: Parser) -> None:
+        self.index = index
+        self.parser = parser
+
+    def __call__(self, path: FilePath) -> Optional[TagMatch]:
+        key = self.parser(path)
+        return (self.index, key) if key is not None else None
+
+
+class _SegmentPatternMatcher:
+    def __init__(self, patterns: List[Tuple[int, SegmentPattern]]) -> None:
+        self._patterns = patterns
+        # Files are listed directory by directory: directory segments are only matched once for all files
+        self._match_dir = functools.lru_cache(maxsize=_MAX_CACHED_DIRS)(self._match_dir_uncached)
+
+    def __call__(self, path: FilePath) -> Optional[TagMatch]:
+        dir_path, separator, file_name = str(path).rpartition("/")
+        for index, pattern, dir_matches in self._match_dir(dir_path if separator else None):
+            key = pattern.match_file(file_name, dir_matches)
+            if key is not None:
+                return index, key
+        return None
+
+    def _match_dir_uncached(self, dir_path: Optional[str]) -> List[Tuple[int, SegmentPattern, List[DirMatch]]]:
+        # Only keep the tags whose directory segments match
+        matches = []
+        for index, pattern in self._patterns:
+            dir_matches = pattern.match_dir(dir_path)
+            if dir_matches:
+                matches.append((index, pattern, dir_matches))
+        return matches
+
+
+class _CombinedPatternMatcher:
+    def __init__(self, parsers: List[Tuple[int, PatternParser]]) -> None:
+        self._parsers = parsers
+        alternatives = []
+        # Map the group marking each tag to the position of the tag in `parsers`, and to the groups of its key parts
+        self._tag_groups: Dict[str, Tuple[int, List[Tuple[KeyPart, str]]]] = {}
+        for position, (index, parser) in enumerate(parsers):
+            tag_group = f"_tag{index}"
+            regex = parser.to_regex(group_prefix=f"{tag_group}_")
+            if parser.anchor is None and _SEGMENT_WILDCARD_PREFIX.match(regex):
+                # A match starting in the middle of a segment could always start one character earlier: only try to
+                # match at the start of segments. This doesn't change results, but it saves many vain attempts
+                regex = "(?<![^/])" + regex
+            # Mark the tag with an empty group at the end of its pattern rather than with a group enclosing it: a
+            # leading group would prevent the regex engine from quickly skipping to the literal prefixes of patterns
+            alternatives.append(f"{regex[:-1]}(?P<{tag_group}>)$")
+            self._tag_groups[tag_group] = (position, [(part, f"{tag_group}_{part}") for part in parser.key_parts])
+        self.regex = re.compile("|".join(alternatives))
+        # Paths can only match if they end with the literal suffix of one of the patterns (if all patterns have one)
+        suffixes = tuple(suffix for _, parser in parsers for suffix in parser.literal_filter.suffixes)  # type: ignore
+        self._suffixes = suffixes if "" not in suffixes else None
+
+    def __call__(self, path: FilePath) -> Optional[TagMatch]:
+        path = str(path)
+        if self._suffixes is not None and not path.endswith(self._suffixes):
+            return None
+        match = self.regex.search(path)
+        if match is None:
+            return None
+        # The marker of a tag is always the last group to be closed
+        position, key_groups = self._tag_groups[match.lastgroup]  # type: ignore[index]
+        # `search` returns the leftmost match, and alternatives matching at the same position are tried in order. So
+        # tags before the matching one can still match the path, but only after the start of the combined match
+        for index, parser in self._parsers[:position]:
+            earlier_match = parser.regex.search(path, match.start() + 1)
+            if earlier_match is not None:
+                return index, frozendict(
+                    {KeyPart(part): value for part, value in earlier_match.groupdict().items() if value is not None}
+                )
+        return self._parsers[position][0], frozendict(
+            {part: match[group] for part, group in key_groups if match[group] is not None}
+        )
+
+
+def _is_combinable(parser: Parser) -> bool:
+    # Regular expressions provided by users may use flags, so only generated regexes can be combined safely
+    return isinstance(parser, PatternParser) and parser.pattern is not None
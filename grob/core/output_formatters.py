@@ -1,9 +1,10 @@
+import os
 from pathlib import Path
-from typing import Dict, List, Mapping, Optional, Union
+from typing import Dict, List, Mapping, Sequence, Union
 
-from grob.types import Group, GroupKey, TagName
+from grob.types import FilePath, Group, GroupKey, TagName
 
-SqueezedGroup = Union[Path, List[Path], None]
+SqueezedGroup = Union[FilePath, List[FilePath], None]
 FormattedGroup = Union[Group, SqueezedGroup]
 FormattedGroups = Union[List[FormattedGroup], Mapping[GroupKey, FormattedGroup]]
 
@@ -11,18 +12,21 @@ FormattedGroups = Union[List[FormattedGroup], Mapping[GroupKey, FormattedGroup]]
 def format_groups(
     groups: Dict[GroupKey, Group],
     tag_names: List[TagName],
-    relative_to: Optional[Path] = None,
+    relative_to: Union[Path, Sequence[Path], None] = None,
     squeeze: bool = True,
     with_keys: bool = True,
 ) -> FormattedGroups:
     if relative_to is not None:
-        # Paths are absolute
+        # Paths are absolute. With several root directories, paths are made relative to the most specific root
+        roots = [relative_to] if isinstance(relative_to, Path) else sorted(relative_to, key=lambda r: -len(r.parts))
+        prefixes = [os.path.join(root, "") for root in roots]
         for group in groups.values():
             for tag, files in group.items():
                 if isinstance(files, list):
-                    group[tag] = sorted(file.relative_to(relative_to) for file in files)
+                    relative_files = [_make_relative(file, roots, prefixes) for file in files]
+                    group[tag] = sorted(relative_files)  # type: ignore[type-var]
                 elif files is not None:
-                    group[tag] = files.relative_to(relative_to)
+                    group[tag] = _make_relative(files, roots, prefixes)
     formatted_groups: Mapping[GroupKey, FormattedGroup]
     if squeeze and len(tag_names) == 1:
         tag_name = tag_names[0]
@@ -33,3 +37,17 @@ def format_groups(
     if with_keys:
         return formatted_groups
     return list(formatted_groups.values())
+
+
+def _make_relative(file: FilePath, roots: List[Path], prefixes: List[str]) -> FilePath:
+    if isinstance(file, str):
+        # Slice strings rather than going through `Path.relative_to`, which is much slower
+        for prefix in prefixes:
+            if file.startswith(prefix):
+                relative_path = file[len(prefix) :]
+                return relative_path if os.sep == "/" else relative_path.replace(os.sep, "/")
+        raise ValueError(f"'{file}' is not in the subpath of '{roots[-1]}'")  # noqa: TRY003
+    for root in roots[:-1]:
+        if root in file.parents:
+            return file.relative_to(root)
+    return file.relative_to(roots[-1])
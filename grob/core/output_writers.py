@@ -3,11 +3,14 @@ import json
 from functools import partial
 from itertools import zip_longest
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Literal, Protocol, TextIO, Union, no_type_check
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Literal, Protocol, TextIO, Union, no_type_check
 
 from grob.core.output_formatters import FormattedGroups
 from grob.types import TagName
 
+if TYPE_CHECKING:
+    from grob.core.watcher import GroupEvent
+
 
 def write_groups(
     groups: FormattedGroups,
@@ -22,6 +25,14 @@ def write_groups(
     formatter(groups, stream, tag_names=tag_names, with_keys=with_keys, squeezed=squeezed)
 
 
+def write_group_events(events: Iterable["GroupEvent"], stream: TextIO) -> None:
+    """Write group events to `stream` as JSON lines, as soon as they are received."""
+    for event in events:
+        record = {"event": event.kind, "key": event.key, "group": event.group}
+        stream.write(json.dumps(record, cls=_PathJSONEncoder) + "\n")
+        stream.flush()
+
+
 class _PathJSONEncoder(json.JSONEncoder):
     def default(self, obj: Any) -> Any:
         if isinstance(obj, Path):
@@ -1,14 +1,19 @@
+import dataclasses
+import os
 import re
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Match, Optional, Pattern, Protocol, Union
+from typing import Any, Callable, Dict, List, Match, Optional, Pattern, Protocol, Tuple, Union
 
 from grob.core.errors import InvalidFlagError
 from grob.core.frozendict import frozendict
-from grob.types import GroupKey, KeyPart
+from grob.types import FilePath, GroupKey, KeyPart
 
 # TODO: replace this by a protocol (a union of `Mapping` and `Hashable`)
 MultiPartKey = frozendict[KeyPart, str]
 REGEX_FLAG: str = ":r"
+# Parts of glob-like patterns that aren't matched literally: `**`, `*`, placeholders, option groups and escapes
+_NON_LITERAL_TOKEN = re.compile(r"/?\*\*/?|\*|\{[^}]*\}\??|\([^)]*\)|[()\\]")
 
 
 class SinglePartParserProtocol(Protocol):
@@ -18,7 +23,7 @@ class SinglePartParserProtocol(Protocol):
     same group of files. Whenever possible, prefer multipart parsers and multipart keys over string keys.
     """
 
-    def __call__(self, path: Path) -> Optional[GroupKey]:
+    def __call__(self, path: FilePath) -> Optional[GroupKey]:
         pass
 
 
@@ -38,7 +43,7 @@ class MultiPartParserProtocol(Protocol):
 
     key_parts: List[KeyPart]
 
-    def __call__(self, path: Path) -> Optional[MultiPartKey]:
+    def __call__(self, path: FilePath) -> Optional[MultiPartKey]:
         pass
 
 
@@ -50,8 +55,9 @@ class CallableMultiPartParser:
         self.func = func
         self.key_parts = [KeyPart(key_part) for key_part in key_parts]
 
-    def __call__(self, path: Path) -> Optional[MultiPartKey]:
-        key = self.func(path)
+    def __call__(self, path: FilePath) -> Optional[MultiPartKey]:
+        # User-provided functions always receive `Path` objects
+        key = self.func(_as_path(path))
         if key is None:
             return None
         return frozendict(key)
@@ -62,22 +68,75 @@ class CallableMultiPartParser:
         )
 
 
+@dataclasses.dataclass(frozen=True)
+class LiteralFilter:
+    """Necessary conditions for a path to match a glob-like pattern, derived from the literal parts of the pattern.
+
+    They are checked with plain string operations, which are much cheaper than a regex search: most paths that can't
+    match a pattern are rejected without running its regex. The default filter accepts all paths.
+    """
+
+    prefix: str = ""
+    suffixes: Tuple[str, ...] = ("",)
+    substrings: Tuple[str, ...] = ()
+    min_separators: int = 0
+
+    @classmethod
+    def from_pattern(cls, pattern: str, anchor: Optional[str] = None) -> "LiteralFilter":
+        """Derive the literal filter of a glob-like pattern.
+
+        Args:
+            pattern: a glob-like pattern, as accepted by `PatternParser`
+            anchor: if provided, the directory the pattern is anchored to
+
+        Returns:
+            a filter accepting all the paths that the pattern matches
+        """
+        literals = _NON_LITERAL_TOKEN.split(pattern)
+        prefix = ""
+        if anchor is not None:
+            # Anchored patterns match the whole path, so the leading literal of the pattern is a prefix too
+            prefix = anchor.rstrip("/") + "/" + literals[0]
+            literals[0] = ""
+        # Patterns always match until the end of the path, but `$` also matches before a trailing newline
+        suffix = literals.pop()
+        suffixes = (suffix, suffix + "\n") if suffix else ("",)
+        return cls(
+            prefix=prefix,
+            suffixes=suffixes,
+            substrings=tuple(literal for literal in literals if literal.strip("/")),
+            min_separators=sum(literal.count("/") for literal in [prefix, *literals, suffix]),
+        )
+
+    def __call__(self, path: str) -> bool:
+        return (
+            path.endswith(self.suffixes)
+            and path.startswith(self.prefix)
+            and path.count("/") >= self.min_separators
+            and all(map(path.__contains__, self.substrings))
+        )
+
+
 class AnonymousParser(CallableMultiPartParser):
     DEFAULT_PART_NAME: KeyPart = KeyPart("path")
 
-    def __init__(self, regex: Pattern) -> None:
+    def __init__(self, regex: Pattern, pattern: Optional[str] = None, anchor: Optional[str] = None) -> None:
+        literal_filter = LiteralFilter.from_pattern(pattern, anchor=anchor) if pattern is not None else LiteralFilter()
         super().__init__(
-            func=lambda path: {"path": path.as_posix()} if regex.search(str(path)) else None,
+            func=partial(_match_whole_path, regex=regex, literal_filter=literal_filter),
             key_parts=[self.DEFAULT_PART_NAME],
         )
+        # Keep the original pattern around, so that it can be analyzed to restrict the search
+        self.pattern = pattern
+        self.anchor = anchor
 
 
 class CallableParser:
     def __init__(self, func: Callable[[Path], Optional[str]]) -> None:
         self.func = func
 
-    def __call__(self, path: Path) -> Optional[GroupKey]:
-        key = self.func(path)
+    def __call__(self, path: FilePath) -> Optional[GroupKey]:
+        key = self.func(_as_path(path))
         return GroupKey(key) if key is not None else None
 
     def __eq__(self, other: Any) -> bool:
@@ -85,7 +144,17 @@ class CallableParser:
 
 
 class PatternParser:
-    def __init__(self, pattern: Union[str, Pattern]) -> None:
+    """Parse paths using a glob-like pattern or a regular expression.
+
+    By default, a pattern can match any suffix of a path: `images/{name}.png` will match both `root/images/a.png` and
+    `root/sub/dir/images/a.png`. If `anchor` is provided, glob-like patterns must instead match the whole path after
+    `anchor`, which allows the walker to skip directories that the pattern cannot reach. Regular expressions are
+    never anchored.
+    """
+
+    def __init__(self, pattern: Union[str, Pattern], anchor: Optional[str] = None) -> None:
+        self.anchor: Optional[str] = None
+        self.literal_filter: Optional[LiteralFilter] = None
         if isinstance(pattern, re.Pattern):
             self.pattern = None
             self.regex = pattern
@@ -94,7 +163,9 @@ class PatternParser:
             self.regex = re.compile(pattern[: -len(REGEX_FLAG)])
         else:
             self.pattern = pattern
-            self.regex = _convert_pattern_to_regex(pattern)
+            self.anchor = anchor
+            self.regex = _convert_pattern_to_regex(pattern, anchor=anchor)
+            self.literal_filter = LiteralFilter.from_pattern(pattern, anchor=anchor)
         self.key_parts = _get_named_parts(self.regex)
 
     def __repr__(self) -> str:
@@ -103,14 +174,44 @@ class PatternParser:
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, PatternParser) and self.regex == other.regex
 
-    def __call__(self, path: Path) -> Optional[MultiPartKey]:
-        matches = self.regex.search(str(path))
+    def to_regex(self, group_prefix: str) -> str:
+        """Return the regular expression of a glob-like pattern, with a prefix added to the name of all groups.
+
+        This allows the regular expressions of several patterns to be combined, even if they share placeholders.
+        """
+        if self.pattern is None:
+            raise ValueError("Only glob-like patterns can be converted")  # noqa: TRY003
+        return _convert_pattern_to_regex(self.pattern, anchor=self.anchor, group_prefix=group_prefix).pattern
+
+    def __call__(self, path: FilePath) -> Optional[MultiPartKey]:
+        # `str` is a no-op on strings, so that string paths are matched without any conversion
+        path = str(path)
+        if self.literal_filter is not None and not self.literal_filter(path):
+            return None
+        matches = self.regex.search(path)
         if not matches:
             return None
         return frozendict({KeyPart(key): value for key, value in matches.groupdict().items() if value is not None})
 
 
-def _create_named_capturing_group(match_obj: Match) -> str:
+def _match_whole_path(path: Path, regex: Pattern, literal_filter: LiteralFilter) -> Optional[Dict[str, str]]:
+    path_str = str(path)
+    if literal_filter(path_str) and regex.search(path_str):
+        return {"path": _as_posix(path)}
+    return None
+
+
+def _as_path(path: FilePath) -> Path:
+    return path if isinstance(path, Path) else Path(path)
+
+
+def _as_posix(path: FilePath) -> str:
+    if isinstance(path, str) and os.sep == "/":
+        return path
+    return Path(path).as_posix()
+
+
+def _create_named_capturing_group(match_obj: Match, group_prefix: str = "") -> str:
     flags = match_obj["flags"] or ""
     if "d" in flags:
         content = r"\d"
@@ -143,10 +244,10 @@ def _create_named_capturing_group(match_obj: Match) -> str:
         raise InvalidFlagError(flags, match_obj.string)
     name = match_obj["placeholder"]
     optional = match_obj["optional"]
-    return f"(?P<{name}>{content}{length_constraint}){optional}"
+    return f"(?P<{group_prefix}{name}>{content}{length_constraint}){optional}"
 
 
-def _convert_pattern_to_regex(pattern: str) -> Pattern:
+def _convert_pattern_to_regex(pattern: str, anchor: Optional[str] = None, group_prefix: str = "") -> Pattern:
     option_groups = []
     for group in re.findall(r"\([^/()]+(?:|[^/()]+)+\)", pattern):
         before = re.escape(group)
@@ -162,10 +263,12 @@ def _convert_pattern_to_regex(pattern: str) -> Pattern:
     # Replace placeholders {name} by named capturing group (P<name>...)
     pattern = re.sub(
         r"\\{(?P<placeholder>[a-zA-Z_]\w*)(?P<flags>:[^}]+)?\\}(?P<optional>\??)",
-        _create_named_capturing_group,
+        partial(_create_named_capturing_group, group_prefix=group_prefix),
         pattern,
     )
     pattern += "$"
+    if anchor is not None:
+        pattern = "^" + re.escape(anchor.rstrip("/") + "/") + pattern
     regex = pattern
     return re.compile(regex)
 
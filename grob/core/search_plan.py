@@ -0,0 +1,101 @@
+import dataclasses
+import itertools
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from grob.core.tags import Tag
+
+DirParts = Tuple[str, ...]
+"""A directory, represented by its path components relative to the root directory."""
+
+MAX_EXPANDED_PREFIXES = 256
+_OPTION_GROUP = re.compile(r"(\([^/()]+\))")
+_NON_LITERAL_CHARACTERS = re.compile(r"[*{}\\]")
+
+
+@dataclasses.dataclass(frozen=True)
+class SearchPlan:
+    """Describe which directories must be walked in order to find all files matching a set of tags.
+
+    Attributes:
+        start_dirs: mapping from the directories to walk to the maximum nesting level of matching files below them. A
+            maximum depth of 0 means that only files located directly in the directory can match, while `None` means
+            that the directory must be walked recursively. Start directories are never nested into one another.
+    """
+
+    start_dirs: Dict[DirParts, Optional[int]]
+
+    @classmethod
+    def full(cls) -> "SearchPlan":
+        """Create a plan that walks the whole root directory."""
+        return cls(start_dirs={(): None})
+
+    @property
+    def is_full(self) -> bool:
+        return self.start_dirs == {(): None}
+
+
+def create_search_plan(tags: Sequence[Tag]) -> SearchPlan:
+    """Analyze tag patterns to find which directories can contain matching files.
+
+    Only anchored patterns can be analyzed: an unanchored pattern matches path suffixes, so it can match files at any
+    nesting level. The same goes for regular expressions and callable parsers. If any tag can't be analyzed, the
+    whole root directory must be walked.
+
+    For each anchored pattern, leading directories that are made of literals and option groups (e.g. `images/` or
+    `(train|val)/`) are used as starting points, and the number of directories in the pattern bounds the nesting
+    level of matching files (unless the pattern contains a double wildcard `**`).
+    """
+    requirements: List[Tuple[DirParts, Optional[int]]] = []
+    for tag in tags:
+        pattern = getattr(tag.parser, "pattern", None)
+        if pattern is None or getattr(tag.parser, "anchor", None) is None:
+            return SearchPlan.full()
+        requirements.extend(_analyze_pattern(pattern))
+    return SearchPlan(start_dirs=_merge_start_dirs(requirements))
+
+
+def _analyze_pattern(pattern: str) -> List[Tuple[DirParts, Optional[int]]]:
+    *dir_segments, _ = pattern.split("/")
+    prefixes: List[DirParts] = [()]
+    for segment in dir_segments:
+        options = _expand_segment(segment)
+        if options is None or len(prefixes) * len(options) > MAX_EXPANDED_PREFIXES:
+            break
+        prefixes = [(*prefix, option) for prefix in prefixes for option in options]
+    if "**" in pattern:
+        max_depth = None
+    else:
+        max_depth = len(dir_segments) - len(prefixes[0])
+    return [(prefix, max_depth) for prefix in prefixes]
+
+
+def _expand_segment(segment: str) -> Optional[List[str]]:
+    # Return all directory names matching `segment`, or None if it contains wildcards, placeholders or escape sequences
+    if _NON_LITERAL_CHARACTERS.search(segment):
+        return None
+    # Odd items are option groups, even items are literals
+    parts = _OPTION_GROUP.split(segment)
+    choices = [part[1:-1].split("|") if i % 2 else [part] for i, part in enumerate(parts)]
+    options = ["".join(choice) for choice in itertools.product(*choices)]
+    if any(option in {"", ".", ".."} for option in options):
+        return None
+    return options
+
+
+def _merge_start_dirs(requirements: List[Tuple[DirParts, Optional[int]]]) -> Dict[DirParts, Optional[int]]:
+    # Process shortest prefixes first, so that nested directories are merged into their closest walked ancestor
+    start_dirs: Dict[DirParts, Optional[int]] = {}
+    for prefix, max_depth in sorted(requirements, key=lambda requirement: len(requirement[0])):
+        ancestor = next((prefix[:i] for i in range(len(prefix) + 1) if prefix[:i] in start_dirs), None)
+        if ancestor is None:
+            start_dirs[prefix] = max_depth
+            continue
+        ancestor_depth = start_dirs[ancestor]
+        if ancestor_depth is None:
+            continue
+        if max_depth is None:
+            start_dirs[ancestor] = None
+        else:
+            start_dirs[ancestor] = max(ancestor_depth, max_depth + len(prefix) - len(ancestor))
+    return start_dirs
@@ -0,0 +1,164 @@
+import re
+from typing import Dict, List, Optional, Pattern, Set, Tuple
+
+from grob.core.parsers import MultiPartKey, _convert_pattern_to_regex
+from grob.core.frozendict import frozendict
+from grob.types import KeyPart
+
+DirMatch = Tuple[Dict[str, Optional[str]], bool]
+"""Key parts bound by the directory segments of a pattern, and whether the file name can match anywhere after them.
+
+The second item is only True when the pattern has no directory segment (e.g. `{name}.png`), or only `**` segments: the
+pattern can then start in the middle of the file name, like a regex search.
+"""
+
+_DOUBLE_WILDCARD = "**"
+# A placeholder whose flags contain a separator can't be matched one segment at a time
+_PLACEHOLDER_WITH_SEPARATOR = re.compile(r"\{[^}]*/")
+
+
+class SegmentPattern:
+    """A glob-like pattern, matched one path segment at a time rather than with a regex over the whole path.
+
+    Each segment of the pattern is compiled to its own regex, and `**` segments are handled by the matcher. All files
+    located in the same directory share the same directory segments, so `match_dir` can be computed (and cached) once
+    per directory: matching a file then only requires matching its name. Directory segments are matched with a
+    memoized search, which is linear in the number of segments of the pattern and of the path, even with several `**`.
+
+    Results are the same as `PatternParser`: when several alignments of the pattern match a path, the one chosen by the
+    regex engine is used (leftmost start, then the most segments consumed by each `**`).
+    """
+
+    def __init__(self, dir_segments: List[Optional[Pattern]], file_segment: Pattern, anchor: Optional[str]) -> None:
+        # `None` stands for `**`
+        self.dir_segments = dir_segments
+        self.file_segment = file_segment
+        self.prefix = "" if anchor is None else anchor.rstrip("/") + "/"
+
+    @classmethod
+    def compile(cls, pattern: str, anchor: Optional[str] = None) -> Optional["SegmentPattern"]:
+        """Compile a glob-like pattern into a segment pattern.
+
+        Args:
+            pattern: a glob-like pattern, as accepted by `PatternParser`
+            anchor: if provided, the directory the pattern is anchored to
+
+        Returns:
+            the segment pattern, or None if the pattern can't be matched one segment at a time (e.g. if it contains
+                `**` inside a segment, like `a**/b`)
+        """
+        if _PLACEHOLDER_WITH_SEPARATOR.search(pattern):
+            return None
+        *dir_segments, file_segment = pattern.split("/")
+        if _DOUBLE_WILDCARD in file_segment or any(
+            _DOUBLE_WILDCARD in segment and segment != _DOUBLE_WILDCARD for segment in dir_segments
+        ):
+            return None
+        return cls(
+            dir_segments=[
+                None if segment == _DOUBLE_WILDCARD else _compile_segment(segment, end=r"\Z")
+                for segment in dir_segments
+            ],
+            file_segment=_compile_segment(file_segment, end="$"),
+            anchor=anchor,
+        )
+
+    def __call__(self, path: str) -> Optional[MultiPartKey]:
+        dir_path, separator, file_name = path.rpartition("/")
+        return self.match_file(file_name, self.match_dir(dir_path if separator else None))
+
+    def match_dir(self, dir_path: Optional[str]) -> List[DirMatch]:
+        """Match the directory segments of the pattern against the directory of a file.
+
+        Args:
+            dir_path: the directory containing the file, without trailing separator, or None if the path of the file
+                contains no separator
+
+        Returns:
+            the ways the file name can then be matched, in order. There are at most two of them: the file name must be
+                matched by the file segment of the pattern, or searched by it. The second way is more permissive, so
+                it is only kept if it comes first.
+        """
+        if dir_path is None:
+            # The pattern can still match a path without separator if it has no directory segment (besides `**`)
+            segments: List[str] = []
+            if self.prefix:
+                return []
+        elif not self.prefix:
+            segments = dir_path.split("/")
+        elif (dir_path + "/").startswith(self.prefix):
+            segments = (dir_path + "/")[len(self.prefix) :].split("/")[:-1]
+        else:
+            return []
+        return _DirSearch(self.dir_segments, segments).run(anchored=bool(self.prefix))
+
+    def match_file(self, file_name: str, dir_matches: List[DirMatch]) -> Optional[MultiPartKey]:
+        """Match a file name, given the matches of its directory returned by `match_dir`."""
+        for key, search in dir_matches:
+            match = self.file_segment.search(file_name) if search else self.file_segment.match(file_name)
+            if match is not None:
+                return frozendict(
+                    {KeyPart(part): value for part, value in {**key, **match.groupdict()}.items() if value is not None}
+                )
+        return None
+
+
+class _DirSearch:
+    # Explore alignments of directory segments in the order of the regex engine, i.e. depth-first, with `**` consuming
+    # as many segments as possible first. States that were already explored can't lead to a new match, so each state
+    # (pattern segment, path segment, whether the pattern can start in the middle of a segment) is explored once.
+
+    def __init__(self, pattern_segments: List[Optional[Pattern]], path_segments: List[str]) -> None:
+        self.pattern_segments = pattern_segments
+        self.path_segments = path_segments
+        self.matches: List[DirMatch] = []
+        self.explored: Set[Tuple[int, int, bool]] = set()
+
+    def run(self, anchored: bool) -> List[DirMatch]:
+        if anchored:
+            self._visit(0, 0, False, {})
+            return self.matches
+        # Unanchored patterns can start anywhere: in any segment, and in the middle of this segment
+        for start in range(len(self.path_segments) + 1):
+            if self._visit(0, start, True, {}):
+                break
+        return self.matches
+
+    def _visit(self, pattern_index: int, path_index: int, search: bool, key: Dict[str, Optional[str]]) -> bool:
+        # Return True once no other match can be useful
+        state = (pattern_index, path_index, search)
+        if state in self.explored:
+            return False
+        self.explored.add(state)
+        if pattern_index == len(self.pattern_segments):
+            if path_index != len(self.path_segments):
+                return False
+            if search:
+                self.matches.append((key, True))
+                return True
+            if not self.matches:
+                self.matches.append((key, False))
+            return False
+        pattern_segment = self.pattern_segments[pattern_index]
+        if pattern_segment is None:
+            # `**` matches non-empty segments, greedily
+            end = path_index
+            while end < len(self.path_segments) and self.path_segments[end]:
+                end += 1
+            for stop in range(end, path_index, -1):
+                if self._visit(pattern_index + 1, stop, False, key):
+                    return True
+            return self._visit(pattern_index + 1, path_index, search, key)
+        if path_index == len(self.path_segments):
+            return False
+        segment = self.path_segments[path_index]
+        match = pattern_segment.search(segment) if search else pattern_segment.match(segment)
+        if match is None:
+            return False
+        return self._visit(pattern_index + 1, path_index + 1, False, {**key, **match.groupdict()})
+
+
+def _compile_segment(segment: str, end: str) -> Pattern:
+    # Reuse the conversion of whole patterns, so that segments are matched exactly like in `PatternParser`
+    regex = _convert_pattern_to_regex(segment).pattern
+    return re.compile(regex[: -len("$")] + end)
@@ -0,0 +1,79 @@
+import csv
+import gzip
+import io
+import json
+from pathlib import Path
+from typing import IO, Any, Iterator, Union
+
+from grob.core.errors import InvalidManifestError
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def read_path_list(stream: IO[str], separator: str = "\n") -> Iterator[str]:
+    """Read paths from a stream, e.g. the output of `find -print0` with `separator="\\0"`.
+
+    Empty paths are skipped. The stream is read in chunks, so that arbitrarily large lists can be processed.
+    """
+    if separator == "\n":
+        for line in stream:
+            path = line.rstrip("\r\n")
+            if path:
+                yield path
+        return
+    remainder = ""
+    while chunk := stream.read(_CHUNK_SIZE):
+        *paths, remainder = (remainder + chunk).split(separator)
+        yield from filter(None, paths)
+    if remainder:
+        yield remainder
+
+
+def read_manifest(manifest: Union[str, Path], column: Union[str, int] = "path") -> Iterator[str]:
+    """Read paths from a CSV or JSON Lines manifest.
+
+    The format is inferred from the file extension: `.csv`, `.tsv`, `.jsonl` or `.ndjson`, optionally followed by `.gz`.
+
+    Args:
+        manifest: path to the manifest file
+        column: which column contains the paths. For CSV files, a string refers to a column name from the header
+            row, while an integer refers to a column index in a file without header (e.g. S3 inventory files). For
+            JSON Lines files, it is the name of the field containing the path
+
+    Yields:
+        paths, in the order of the manifest
+    """
+    manifest = Path(manifest)
+    suffixes = [suffix.lower() for suffix in manifest.suffixes]
+    compressed = suffixes[-1:] == [".gz"]
+    extension = suffixes[-2] if compressed and len(suffixes) > 1 else suffixes[-1] if suffixes else ""
+    with _open_text(manifest, compressed=compressed) as stream:
+        if extension in {".jsonl", ".ndjson"}:
+            yield from _read_jsonl_manifest(stream, field=str(column))
+        elif extension in {".csv", ".tsv"}:
+            yield from _read_csv_manifest(stream, column=column, delimiter="\t" if extension == ".tsv" else ",")
+        else:
+            raise InvalidManifestError(manifest)
+
+
+def _open_text(path: Path, compressed: bool) -> IO[str]:
+    if compressed:
+        return io.TextIOWrapper(gzip.open(path), newline="")
+    return path.open(newline="")
+
+
+def _read_csv_manifest(stream: IO[str], column: Union[str, int], delimiter: str) -> Iterator[str]:
+    reader: Any
+    if isinstance(column, int):
+        reader = csv.reader(stream, delimiter=delimiter)
+    else:
+        reader = csv.DictReader(stream, delimiter=delimiter)
+    for row in reader:
+        if row and row[column]:
+            yield row[column]
+
+
+def _read_jsonl_manifest(stream: IO[str], field: str) -> Iterator[str]:
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)[field]
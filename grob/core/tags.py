@@ -1,6 +1,7 @@
 import dataclasses
 import re
-from typing import Any, Dict, Iterable, List, Union
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from grob.core import parsers
 from grob.core.errors import InvalidParserSpecificationError, InvalidTagSpecificationError
@@ -15,6 +16,7 @@ class Tag:
     parser: parsers.Parser
     on_missing: OnMissing = OnMissing.fail
     allow_multiple: bool = False
+    root: Optional[Path] = None
 
 
 @dataclasses.dataclass
@@ -46,8 +48,10 @@ class SinglePartTag(Tag):
             raise TypeError("__init__() missing 1 required positional argument: 'parser'")  # noqa: TRY003
 
 
-def create_tags(raw_specs: Union[TagSpec, Dict[str, TagSpec]]) -> List[Tag]:
-    specs = _normalize_spec(raw_specs)
+def create_tags(raw_specs: Union[TagSpec, Dict[str, TagSpec]], anchor: Optional[str] = None) -> List[Tag]:
+    # If `anchor` is provided, patterns are anchored to it, except for tags with their own root directory: they are
+    # anchored to their root directory instead
+    specs = _normalize_spec(raw_specs, anchor=anchor)
     # Use a dict to preserve insertion order
     all_key_parts = list(
         {key_part: None for spec in specs.values() for key_part in getattr(spec["parser"], "key_parts", [])}
@@ -64,12 +68,14 @@ def create_tag(
     on_missing: OnMissing = OnMissing.fail,
     distribute: bool = False,
     distribute_over: Iterable[str] = (),
+    root: Optional[Path] = None,
 ) -> Tag:
     common_arguments = {
         "name": TagName(name),
         "parser": parser,
         "on_missing": on_missing,
         "allow_multiple": allow_multiple,
+        "root": root,
     }
     if isinstance(parser, parsers.CallableParser) or not hasattr(parser, "key_parts"):
         return SinglePartTag(**common_arguments)  # type: ignore[arg-type]
@@ -85,29 +91,35 @@ def create_tag(
         return MultiPartTag(**common_arguments)  # type: ignore[arg-type]
 
 
-def _normalize_spec(spec: Union[TagSpec, Dict[str, TagSpec]]) -> Dict[TagName, Dict[str, Any]]:
+def _normalize_spec(
+    spec: Union[TagSpec, Dict[str, TagSpec]], anchor: Optional[str] = None
+) -> Dict[TagName, Dict[str, Any]]:
     # Any is not actually Any, it's a TypedDict with a mandatory parser and optional keys
     if isinstance(spec, (str, re.Pattern)) or callable(spec):
         spec = {DEFAULT_TAG_NAME: spec}
     normalized_spec = {}
     for raw_tag_name, raw_tag_spec in spec.items():
         tag_spec = _convert_raw_spec_to_dict(raw_tag_spec)
-        parser = _create_parser_from_spec(tag_spec)
+        tag_anchor = anchor
+        if tag_spec.get("root") is not None:
+            tag_spec["root"] = Path(tag_spec["root"]).resolve()
+            tag_anchor = tag_spec["root"].as_posix() if anchor is not None else None
+        parser = _create_parser_from_spec(tag_spec, anchor=tag_anchor)
         if isinstance(parser, parsers.PatternParser) and len(parser.key_parts) == 0 and len(spec) == 1:
             # This is a very special case: when a single tag is declared, and this tag uses pattern, and this pattern
             # has no named part, we convert it to a special callable parser that uses the full path as pattern. This
             # allows simple, single-tag specs with only wildcards and no placeholders
-            parser = parsers.AnonymousParser(regex=parser.regex)
+            parser = parsers.AnonymousParser(regex=parser.regex, pattern=parser.pattern, anchor=parser.anchor)
         if "on_missing" in tag_spec:
             tag_spec["on_missing"] = OnMissing(tag_spec["on_missing"])
         normalized_spec[TagName(raw_tag_name)] = {"parser": parser, **tag_spec}
     return normalized_spec
 
 
-def _create_parser_from_spec(raw_tag_spec: Dict[str, Any]) -> parsers.Parser:
+def _create_parser_from_spec(raw_tag_spec: Dict[str, Any], anchor: Optional[str] = None) -> parsers.Parser:
     parser_spec = raw_tag_spec.pop("spec")
     if isinstance(parser_spec, (str, re.Pattern)):
-        return parsers.PatternParser(parser_spec)
+        return parsers.PatternParser(parser_spec, anchor=anchor)
     elif not callable(parser_spec):
         raise InvalidParserSpecificationError(parser_spec)
     elif (key_parts := raw_tag_spec.pop("key_parts", None)) is not None:
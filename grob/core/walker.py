@@ -1,15 +1,224 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Iterable
-
-
-def walk(root_dir: Path) -> Iterable[Path]:
-    """Iterate over all files in `root_dir`."""
-    # TODO: parse tag patterns to restrict which subdirectories are searched. This is a brute-force implementation
-    #  in order to have a MVP soon enough, but there's got to be a better way. Typically we want to analyze parsers
-    #   in order to identify:
-    #   - fixed suffix path (to directly search in the most precise directories as possible)
-    #   - double wildcards (if there are none, we can stop once the maximum nesting level is reached
-    for path in root_dir.rglob("*"):
-        if path.is_dir():
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from grob.core.ignore_rules import IgnoreRules
+from grob.core.search_plan import SearchPlan
+
+DirLister = Callable[[str], Tuple[List[str], List[str]]]
+"""A function returning the paths of files and subdirectories located directly in a directory."""
+
+TreeLister = Callable[[str], Iterable[str]]
+"""A function returning the paths of all files located below a directory, at any nesting level."""
+
+# Directory to list, along with the maximum nesting level of files below it (`None` if unbounded)
+_DirToList = Tuple[str, Optional[int]]
+# Identifies a physical file or directory: device and inode numbers
+_FileId = Tuple[int, int]
+# Number of directory listings that can be scheduled in advance, for each worker thread
+PENDING_LISTINGS_PER_WORKER = 4
+
+
+def walk(
+    root_dir: Path,
+    search_plan: Optional[SearchPlan] = None,
+    workers: int = 1,
+    lister: Optional[DirLister] = None,
+    ignore_rules: Optional[IgnoreRules] = None,
+    as_strings: bool = False,
+    tree_lister: Optional[TreeLister] = None,
+    follow_symlinks: bool = False,
+    skip_duplicate_files: bool = False,
+) -> Iterable[Union[Path, str]]:
+    """Iterate over all files in `root_dir`.
+
+    Directories are listed with `os.scandir`, which provides the type of each entry without an extra `stat` call on
+    most filesystems. By default, symbolic links to directories are neither followed nor returned.
+
+    Args:
+        root_dir: directory to walk recursively
+        search_plan: if provided, only walk the directories listed in the plan, and don't go deeper than the maximum
+            nesting level of each directory. By default, walk all subdirectories
+        workers: number of threads listing directories concurrently. Listing directories is mostly waiting for the
+            filesystem, so using several threads speeds up the walk on high-latency filesystems (e.g. network
+            storage). Files are yielded in the same order regardless of the number of workers
+        lister: function returning the files and subdirectories of a directory, e.g. `ListingCache.list_dir`. By
+            default, use `list_dir`
+        ignore_rules: if provided, skip files and directories matching these rules. Excluded directories are never
+            listed
+        as_strings: if True, yield paths as strings instead of `Path` objects. Creating millions of `Path` objects
+            takes a significant share of the search time and memory
+        tree_lister: if provided, directories that must be walked recursively are listed at once with this function,
+            instead of listing their subdirectories one by one. On object stores, a single flat listing of a prefix is
+            much cheaper than one delimited listing per "directory"
+        follow_symlinks: if True, walk symbolic links to directories. Each physical directory, identified by its
+            device and inode numbers, is only listed once: directories reachable through several links are only
+            walked from the first one, and symbolic link loops are harmless
+        skip_duplicate_files: if True, only yield the first path to each physical file, i.e. skip hard links and
+            symbolic links to files that were already yielded. This requires a `stat` call for each file
+
+    Yields:
+        paths to the files found in `root_dir`
+    """
+    if search_plan is None:
+        search_plan = SearchPlan.full()
+    start_dirs = [
+        (os.path.join(root_dir, *dir_parts), max_depth)
+        for dir_parts, max_depth in search_plan.start_dirs.items()
+        if ignore_rules is None or not _is_any_parent_ignored(dir_parts, ignore_rules)
+    ]
+    if tree_lister is not None:
+        recursive_dirs = [dir_path for dir_path, max_depth in start_dirs if max_depth is None]
+        start_dirs = [(dir_path, max_depth) for dir_path, max_depth in start_dirs if max_depth is not None]
+        file_paths = _list_trees(recursive_dirs, tree_lister, root=os.fspath(root_dir), ignore_rules=ignore_rules)
+        yield from file_paths if as_strings else map(Path, file_paths)
+    lister = lister or partial(list_dir, follow_symlinks=follow_symlinks)
+    if ignore_rules is not None:
+        lister = partial(_list_dir_without_ignored, lister=lister, root=os.fspath(root_dir), ignore_rules=ignore_rules)
+    visited_dirs: Optional[Set[_FileId]] = set() if follow_symlinks else None
+    if workers <= 1:
+        file_paths = _scan(start_dirs, lister, visited_dirs=visited_dirs)
+        yield from _format_file_paths(file_paths, as_strings=as_strings, skip_duplicates=skip_duplicate_files)
+        return
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="grob-walker") as executor:
+        max_pending = workers * PENDING_LISTINGS_PER_WORKER
+        file_paths = _scan_concurrently(start_dirs, lister, executor, max_pending, visited_dirs=visited_dirs)
+        yield from _format_file_paths(file_paths, as_strings=as_strings, skip_duplicates=skip_duplicate_files)
+
+
+def _scan(start_dirs: List[_DirToList], lister: DirLister, visited_dirs: Optional[Set[_FileId]]) -> Iterator[str]:
+    # Depth-first traversal: files from a directory are yielded before the content of its subdirectories
+    stack = list(reversed(start_dirs))
+    while stack:
+        dir_path, max_depth = stack.pop()
+        if visited_dirs is not None and not _visit(dir_path, visited_dirs):
+            continue
+        file_paths, sub_dirs = lister(dir_path)
+        yield from file_paths
+        stack.extend(_get_dirs_to_list(sub_dirs, max_depth))
+
+
+def _scan_concurrently(
+    start_dirs: List[_DirToList],
+    lister: DirLister,
+    executor: ThreadPoolExecutor,
+    max_pending: int,
+    visited_dirs: Optional[Set[_FileId]],
+) -> Iterator[str]:
+    # Same traversal as `_scan`, but the next directories to visit are listed in advance by the executor. At most
+    # `max_pending` listings are scheduled at any time, to bound memory usage on very wide trees
+    stack = list(reversed(start_dirs))
+    pending: Dict[str, Future] = {}
+    while stack:
+        for dir_path, _ in reversed(stack):
+            if len(pending) >= max_pending:
+                break
+            if dir_path not in pending:
+                pending[dir_path] = executor.submit(lister, dir_path)
+        dir_path, max_depth = stack.pop()
+        listing = pending.pop(dir_path)
+        # Directories are marked as visited in traversal order, so that the output doesn't depend on scheduling
+        if visited_dirs is not None and not _visit(dir_path, visited_dirs):
+            continue
+        file_paths, sub_dirs = listing.result()
+        yield from file_paths
+        stack.extend(_get_dirs_to_list(sub_dirs, max_depth))
+
+
+def _visit(dir_path: str, visited_dirs: Set[_FileId]) -> bool:
+    # Return False if the directory was already visited, possibly through another path
+    try:
+        stat = os.stat(dir_path)
+    except OSError:
+        return False
+    dir_id = (stat.st_dev, stat.st_ino)
+    if dir_id in visited_dirs:
+        return False
+    visited_dirs.add(dir_id)
+    return True
+
+
+def _format_file_paths(
+    file_paths: Iterable[str], as_strings: bool, skip_duplicates: bool
+) -> Iterable[Union[Path, str]]:
+    if skip_duplicates:
+        file_paths = _skip_duplicate_files(file_paths)
+    return file_paths if as_strings else map(Path, file_paths)
+
+
+def _skip_duplicate_files(file_paths: Iterable[str]) -> Iterator[str]:
+    seen_files: Set[_FileId] = set()
+    for file_path in file_paths:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            # Broken symbolic link, or file removed in the meantime
+            yield file_path
             continue
-        yield path
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id not in seen_files:
+            seen_files.add(file_id)
+            yield file_path
+
+
+def _list_trees(
+    dir_paths: List[str], tree_lister: TreeLister, root: str, ignore_rules: Optional[IgnoreRules]
+) -> Iterator[str]:
+    prefix_length = len(os.path.join(root, ""))
+    for dir_path in dir_paths:
+        for file_path in tree_lister(dir_path):
+            relative_path = file_path[prefix_length:].replace(os.sep, "/")
+            if ignore_rules is None or not ignore_rules.is_file_ignored(relative_path):
+                yield file_path
+
+
+def _get_dirs_to_list(sub_dirs: List[str], max_depth: Optional[int]) -> List[_DirToList]:
+    # Return subdirectories in reverse order, so that they are popped from the stack in listing order
+    if max_depth is None:
+        return [(sub_dir, None) for sub_dir in reversed(sub_dirs)]
+    if max_depth > 0:
+        return [(sub_dir, max_depth - 1) for sub_dir in reversed(sub_dirs)]
+    return []
+
+
+def _is_any_parent_ignored(dir_parts: Tuple[str, ...], ignore_rules: IgnoreRules) -> bool:
+    return any(ignore_rules.is_ignored("/".join(dir_parts[:i]), is_dir=True) for i in range(1, len(dir_parts) + 1))
+
+
+def _list_dir_without_ignored(
+    dir_path: str, lister: DirLister, root: str, ignore_rules: IgnoreRules
+) -> Tuple[List[str], List[str]]:
+    file_paths, sub_dirs = lister(dir_path)
+    # Rules are matched against POSIX paths relative to the root directory
+    prefix_length = len(os.path.join(root, ""))
+    file_paths = [
+        path
+        for path in file_paths
+        if not ignore_rules.is_ignored(path[prefix_length:].replace(os.sep, "/"), is_dir=False)
+    ]
+    sub_dirs = [
+        path for path in sub_dirs if not ignore_rules.is_ignored(path[prefix_length:].replace(os.sep, "/"), is_dir=True)
+    ]
+    return file_paths, sub_dirs
+
+
+def list_dir(dir_path: str, follow_symlinks: bool = False) -> Tuple[List[str], List[str]]:
+    """Return the paths of files and subdirectories located directly in `dir_path`.
+
+    Symbolic links to directories are only returned as subdirectories if `follow_symlinks` is True.
+    """
+    file_paths = []
+    sub_dirs = []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                # `is_dir` only needs a system call for symbolic links, the entry type is cached otherwise
+                if not entry.is_dir():
+                    file_paths.append(entry.path)
+                elif follow_symlinks or not entry.is_symlink():
+                    sub_dirs.append(entry.path)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        pass
+    return file_paths, sub_dirs
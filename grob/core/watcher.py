@@ -0,0 +1,242 @@
+import dataclasses
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Literal, Optional, Set, Tuple, Union
+
+from grob.core.files import FileCollection, group_by_key
+from grob.core.group_validation import filter_and_validate_groups
+from grob.core.inotify import (
+    IN_CREATE,
+    IN_DELETE,
+    IN_ISDIR,
+    IN_MOVED_FROM,
+    IN_MOVED_TO,
+    IN_Q_OVERFLOW,
+    Inotify,
+    InotifyUnavailableError,
+)
+from grob.core.key_formatters import KeyFormatter, get_key_formatter
+from grob.core.matchers import TagMatch, TagMatcher
+from grob.core.output_formatters import FormattedGroup, format_groups
+from grob.core.parsers import MultiPartKey
+from grob.core.tags import Tag, create_tags
+from grob.core.walker import list_dir, walk
+from grob.types import GroupKey, OnMissing, TagSpec
+
+EventKind = Literal["added", "completed", "changed", "removed"]
+# Delay during which events are accumulated before updating groups, in seconds
+DEBOUNCE_DELAY = 0.05
+
+
+@dataclasses.dataclass(frozen=True)
+class GroupEvent:
+    """A change in a group of files.
+
+    Attributes:
+        kind: `added` for a new group, `completed` for a group that was missing mandatory tags, `changed` when the files
+            of a group changed, `removed` when a group disappeared or is missing mandatory tags
+        key: key of the group
+        group: files in the group, after the change (or before the change, for removed groups)
+    """
+
+    kind: EventKind
+    key: GroupKey
+    group: FormattedGroup
+
+
+@dataclasses.dataclass
+class _Changes:
+    touched: Set[Path] = dataclasses.field(default_factory=set)
+    removed: Set[Path] = dataclasses.field(default_factory=set)
+    removed_dirs: Set[Path] = dataclasses.field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.touched or self.removed or self.removed_dirs)
+
+
+def watch(
+    patterns: Union[TagSpec, Dict[str, TagSpec]],
+    root_dir: Union[str, Path],
+    key_formatter: Union[str, Callable[[MultiPartKey], GroupKey], None] = None,
+    use_relative_paths: bool = False,
+    squeeze: bool = True,
+    anchored: bool = False,
+    poll_interval: float = 1.0,
+    use_inotify: bool = True,
+) -> Iterator[GroupEvent]:
+    """Find and group files, then keep groups up to date as files are added or removed.
+
+    The whole root directory is walked once, and an `added` event is emitted for each group. Then, `watch` waits for
+    changes, re-parses only the paths that changed and emits one event for each group that changed. Incomplete groups
+    never fail: they are reported once all their mandatory tags are found.
+
+    Changes are detected with inotify on Linux. On other platforms, or if `use_inotify` is False, the root directory is
+    listed again every `poll_interval` seconds.
+
+    Args:
+        patterns: describes how to find and group files, see `find`
+        root_dir: where to look for files
+        key_formatter: specify how to format keys, see `find`
+        use_relative_paths: if True, return paths relative to `root_dir`. Otherwise, return absolute paths
+        squeeze: if True, the tag is omitted from the groups when there is only one tag
+        anchored: if True, glob-like patterns must match the whole path relative to `root_dir`
+        poll_interval: when polling, how often the root directory is listed, in seconds
+        use_inotify: whether to use inotify when available
+
+    Yields:
+        changes in groups, as soon as they are detected. This generator never stops by itself
+    """
+    root_dir = Path(root_dir).resolve()
+    tags = create_tags(patterns, anchor=root_dir.as_posix() if anchored else None)
+    groups = _WatchedGroups(
+        tags,
+        key_formatter=get_key_formatter(key_formatter, tags=tags),
+        relative_to=root_dir if use_relative_paths else None,
+        squeeze=squeeze,
+    )
+    source = _create_change_source(root_dir, poll_interval=poll_interval, use_inotify=use_inotify)
+    try:
+        yield from groups.update(_Changes(touched=source.scan()))
+        while True:
+            yield from groups.update(source.wait_for_changes())
+    finally:
+        source.close()
+
+
+class _WatchedGroups:
+    def __init__(
+        self, tags: List[Tag], key_formatter: KeyFormatter, relative_to: Optional[Path], squeeze: bool
+    ) -> None:
+        self.tags = tags
+        # Incomplete groups are not an error: they are kept aside until they are completed
+        self.lenient_tags = [
+            dataclasses.replace(tag, on_missing=OnMissing.skip) if tag.on_missing == OnMissing.fail else tag
+            for tag in tags
+        ]
+        self.match_tag = TagMatcher(tags)
+        self.key_formatter = key_formatter
+        self.relative_to = relative_to
+        self.squeeze = squeeze
+        self.matches: Dict[Path, TagMatch] = {}
+        self.groups: Dict[GroupKey, FormattedGroup] = {}
+        self.incomplete_groups: Set[GroupKey] = set()
+
+    def update(self, changes: _Changes) -> List[GroupEvent]:
+        for removed_dir in changes.removed_dirs:
+            for path in [path for path in self.matches if removed_dir in path.parents]:
+                del self.matches[path]
+        for path in changes.removed:
+            self.matches.pop(path, None)
+        for path in sorted(changes.touched):
+            self.matches.pop(path, None)
+            if os.path.lexists(path) and not path.is_dir() and (match := self.match_tag(path)) is not None:
+                self.matches[path] = match
+        return self._update_groups()
+
+    def _update_groups(self) -> List[GroupEvent]:
+        collections = [FileCollection(tag=tag) for tag in self.tags]
+        for path, (index, key) in self.matches.items():
+            collections[index].add(path, key)
+        all_groups = group_by_key(collections, key_formatter=self.key_formatter)
+        complete_groups = filter_and_validate_groups(all_groups, tags=self.lenient_tags)
+        groups: Dict[GroupKey, FormattedGroup] = format_groups(  # type: ignore[assignment]
+            complete_groups,
+            tag_names=[tag.name for tag in self.tags],
+            relative_to=self.relative_to,
+            squeeze=self.squeeze,
+            with_keys=True,
+        )
+        events = []
+        for key, group in groups.items():
+            if key not in self.groups:
+                events.append(GroupEvent("completed" if key in self.incomplete_groups else "added", key, group))
+            elif group != self.groups[key]:
+                events.append(GroupEvent("changed", key, group))
+        events.extend(GroupEvent("removed", key, group) for key, group in self.groups.items() if key not in groups)
+        self.groups = groups
+        self.incomplete_groups = all_groups.keys() - groups.keys()
+        return sorted(events, key=lambda event: event.key)
+
+
+class _PollingSource:
+    def __init__(self, root_dir: Path, poll_interval: float) -> None:
+        self.root_dir = root_dir
+        self.poll_interval = poll_interval
+        self.files: Set[Path] = set()
+
+    def scan(self) -> Set[Path]:
+        self.files = set(walk(self.root_dir))
+        return self.files
+
+    def wait_for_changes(self) -> _Changes:
+        while True:
+            time.sleep(self.poll_interval)
+            previous_files = self.files
+            files = self.scan()
+            changes = _Changes(touched=files - previous_files, removed=previous_files - files)
+            if changes:
+                return changes
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifySource:
+    def __init__(self, root_dir: Path, poll_interval: float) -> None:
+        self.root_dir = root_dir
+        self.poll_interval = poll_interval
+        self.inotify = Inotify()
+
+    def scan(self, dir_path: Optional[Path] = None) -> Set[Path]:
+        # Watch directories before listing them, so that no file created in the meantime is missed
+        return set(walk(dir_path or self.root_dir, lister=self._watch_and_list))
+
+    def _watch_and_list(self, dir_path: str) -> Tuple[List[str], List[str]]:
+        self.inotify.add_watch(dir_path)
+        return list_dir(dir_path)
+
+    def wait_for_changes(self) -> _Changes:
+        while True:
+            events = self.inotify.read_events(timeout=self.poll_interval)
+            if not events:
+                continue
+            # Wait a bit, since changes often come in bursts
+            while more_events := self.inotify.read_events(timeout=DEBOUNCE_DELAY):
+                events.extend(more_events)
+            changes = self._to_changes(events)
+            if changes:
+                return changes
+
+    def _to_changes(self, events: List[Tuple[str, int]]) -> _Changes:
+        changes = _Changes()
+        for raw_path, mask in events:
+            if mask & IN_Q_OVERFLOW:
+                # Some events were lost: start from scratch
+                return _Changes(touched=self.scan(), removed_dirs={self.root_dir})
+            path = Path(raw_path)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                changes.touched |= self.scan(path)
+            elif mask & IN_ISDIR and mask & (IN_DELETE | IN_MOVED_FROM):
+                changes.removed_dirs.add(path)
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                changes.removed.add(path)
+                changes.touched.discard(path)
+            elif not mask & IN_ISDIR:
+                changes.touched.add(path)
+                changes.removed.discard(path)
+        return changes
+
+    def close(self) -> None:
+        self.inotify.close()
+
+
+def _create_change_source(
+    root_dir: Path, poll_interval: float, use_inotify: bool
+) -> Union[_InotifySource, _PollingSource]:
+    if use_inotify:
+        try:
+            return _InotifySource(root_dir, poll_interval=poll_interval)
+        except InotifyUnavailableError:
+            pass
+    return _PollingSource(root_dir, poll_interval=poll_interval)
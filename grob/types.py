@@ -14,7 +14,10 @@ A key is usually obtained by joining key parts in a fixed order.
 TagName = NewType("TagName", str)
 """Represents a specific type of file within a group."""
 
-Group = Dict[TagName, Union[Path, List[Path], None]]
+FilePath = Union[str, Path]
+"""Represents the path to a file. Paths are strings when searching with `as_strings=True`, `Path` objects otherwise."""
+
+Group = Dict[TagName, Union[FilePath, List[FilePath], None]]
 """Represents a group of files that share the same key, broken down by tag."""
 
 TagSpec = Union[str, Pattern, Callable[[Path], str]]
@@ -0,0 +1,73 @@
+"""Compare the `os.scandir`-based walker to the original `Path.rglob` implementation.
+
+Usage:
+    poetry run python scripts/benchmark_walk.py                 # benchmark on a synthetic tree
+    poetry run python scripts/benchmark_walk.py /path/to/root   # benchmark on an existing directory
+"""
+
+import argparse
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from grob.core.walker import walk
+
+
+def walk_with_rglob(root_dir: Path) -> Iterable[Path]:
+    """Original implementation, calling `stat` once for each path."""
+    for path in root_dir.rglob("*"):
+        if path.is_dir():
+            continue
+        yield path
+
+
+def create_tree(root_dir: Path, n_dirs: int, n_files: int, depth: int) -> None:
+    for i in range(n_dirs):
+        directory = root_dir.joinpath(*(f"dir_{i}_{level}" for level in range(depth)))
+        directory.mkdir(parents=True, exist_ok=True)
+        for j in range(n_files):
+            (directory / f"file_{j}.txt").touch()
+
+
+def benchmark(name: str, walker: Callable[[Path], Iterable[Path]], root_dir: Path, repeat: int) -> Optional[int]:
+    timings = []
+    n_files = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        n_files = sum(1 for _ in walker(root_dir))
+        timings.append(time.perf_counter() - start)
+    best, mean = min(timings) * 1000, sum(timings) / repeat * 1000
+    print(f"{name:<10} {n_files:>10} files  best {best:8.1f} ms  mean {mean:8.1f} ms")
+    return n_files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("root_dir", nargs="?", type=Path, default=None, help="Directory to walk.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs for each walker.")
+    parser.add_argument("--dirs", type=int, default=200, help="Number of directories in the synthetic tree.")
+    parser.add_argument("--files", type=int, default=100, help="Number of files per directory in the synthetic tree.")
+    parser.add_argument("--depth", type=int, default=3, help="Nesting level of the synthetic tree.")
+    parser.add_argument("--walk-workers", type=int, default=4, help="Number of threads for the concurrent walker.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root_dir = args.root_dir
+        if root_dir is None:
+            root_dir = Path(tmp_dir)
+            create_tree(root_dir, n_dirs=args.dirs, n_files=args.files, depth=args.depth)
+        n_expected = benchmark("rglob", walk_with_rglob, root_dir, repeat=args.repeat)
+        for name, walker in [
+            ("scandir", walk),
+            (f"scandir-{args.walk_workers}", partial(walk, workers=args.walk_workers)),
+        ]:
+            n_found = benchmark(name, walker, root_dir, repeat=args.repeat)
+            if n_found != n_expected:
+                message = f"Walkers disagree: {n_expected} files with rglob, {n_found} with {name}"
+                raise RuntimeError(message)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from grob.core.archives import iter_archive_files
+from grob.core.errors import UnsupportedArchiveError
+from grob.core.ignore_rules import IgnoreRules
+
+MEMBERS = ["a.txt", "b/c.txt", ".git/config"]
+
+
+@pytest.fixture
+def zip_archive(tmp_path):
+    archive = tmp_path / "data.zip"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("b/", "")
+        for member in MEMBERS:
+            zip_file.writestr(member, "content")
+    yield archive
+
+
+@pytest.fixture
+def tar_archive(tmp_path):
+    archive = tmp_path / "data.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar_file:
+        directory = tarfile.TarInfo("./b")
+        directory.type = tarfile.DIRTYPE
+        tar_file.addfile(directory)
+        for member in MEMBERS:
+            info = tarfile.TarInfo(f"./{member}")
+            info.size = len(b"content")
+            tar_file.addfile(info, io.BytesIO(b"content"))
+    yield archive
+
+
+@pytest.mark.parametrize("archive_name", ["zip_archive", "tar_archive"])
+def test_iter_archive_files(archive_name, request):
+    archive = request.getfixturevalue(archive_name)
+    assert list(iter_archive_files(archive)) == [archive / member for member in MEMBERS]
+    assert list(iter_archive_files(archive, as_strings=True)) == [f"{archive}/{member}" for member in MEMBERS]
+
+
+def test_iter_archive_files_with_ignore_rules(zip_archive):
+    ignore_rules = IgnoreRules.from_options(exclude=[".git/", "c.txt"])
+    assert list(iter_archive_files(zip_archive, ignore_rules=ignore_rules)) == [zip_archive / "a.txt"]
+
+
+def test_iter_archive_files_with_unsupported_file(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("not an archive")
+    with pytest.raises(UnsupportedArchiveError):
+        list(iter_archive_files(path))
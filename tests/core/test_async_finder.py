@@ -0,0 +1,61 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from grob import find, find_async, iter_groups_async
+from grob.core.errors import SearchCancelledError
+from grob.core.finder import _find
+
+SPEC = {"image": "{name}.png", "label": "{name}.json"}
+
+
+@pytest.fixture
+def root_dir(tmp_path):
+    for name in ["a", "b", "c"]:
+        (tmp_path / f"{name}.png").touch()
+        (tmp_path / f"{name}.json").touch()
+    yield tmp_path
+
+
+def test_find_async(root_dir):
+    result = asyncio.run(find_async(SPEC, root_dir, use_relative_paths=True))
+    assert result == find(SPEC, root_dir, use_relative_paths=True)
+
+
+def test_iter_groups_async(root_dir):
+    async def collect():
+        return [item async for item in iter_groups_async(SPEC, root_dir, use_relative_paths=True)]
+
+    assert asyncio.run(collect()) == list(find(SPEC, root_dir, use_relative_paths=True).items())
+
+
+def test_find_with_cancelled_event(root_dir):
+    cancel_event = threading.Event()
+    cancel_event.set()
+    with pytest.raises(SearchCancelledError):
+        _find(SPEC, root_dir, cancel_event=cancel_event)
+
+
+def test_cancel_find_async(root_dir):
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_parser(path):
+        started.set()
+        release.wait(timeout=5)
+        return None
+
+    async def cancel_search(executor):
+        task = asyncio.ensure_future(find_async({"blocked": blocking_parser}, root_dir, executor=executor))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        finally:
+            release.set()
+
+    with ThreadPoolExecutor(max_workers=1) as executor, pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancel_search(executor))
@@ -0,0 +1,105 @@
+import pytest
+
+from grob import find
+from grob.core.filesystems import InMemoryObjectStore, ObjectStoreFileSystem, S3Client
+
+KEYS = [
+    "datasets/train/images/a.png",
+    "datasets/train/images/b.png",
+    "datasets/train/labels/a.json",
+    "datasets/train/labels/b.json",
+    "datasets/train/labels/",
+    "datasets/val/images/c.png",
+    "logs/2024/run.log",
+    "readme.md",
+]
+
+
+@pytest.fixture
+def object_store():
+    yield InMemoryObjectStore({"bucket": KEYS}, page_size=2)
+
+
+@pytest.mark.parametrize(
+    "prefix, delimiter, expected_keys, expected_prefixes",
+    [
+        ("", "/", ["readme.md"], ["datasets/", "logs/"]),
+        ("datasets/train/", "/", [], ["datasets/train/images/", "datasets/train/labels/"]),
+        ("datasets/train/labels/", "/", ["datasets/train/labels/", *KEYS[2:4]], []),
+        ("datasets/val/", None, ["datasets/val/images/c.png"], []),
+        ("unknown/", "/", [], []),
+    ],
+)
+def test_in_memory_object_store(object_store, prefix, delimiter, expected_keys, expected_prefixes):
+    pages = list(object_store.list_objects("bucket", prefix=prefix, delimiter=delimiter))
+    assert all(len(keys) + len(prefixes) <= 2 for keys, prefixes in pages)
+    assert sorted(key for keys, _ in pages for key in keys) == sorted(expected_keys)
+    assert [prefix for _, prefixes in pages for prefix in prefixes] == expected_prefixes
+
+
+def test_object_store_list_dir(object_store):
+    filesystem = ObjectStoreFileSystem(object_store)
+    assert filesystem.list_dir("/bucket") == (["/bucket/readme.md"], ["/bucket/datasets", "/bucket/logs"])
+    assert filesystem.list_dir("/bucket/datasets/train/labels") == (
+        ["/bucket/datasets/train/labels/a.json", "/bucket/datasets/train/labels/b.json"],
+        [],
+    )
+
+
+def test_object_store_list_tree(object_store):
+    filesystem = ObjectStoreFileSystem(object_store)
+    assert list(filesystem.list_tree("/bucket/datasets/train")) == [
+        "/bucket/datasets/train/images/a.png",
+        "/bucket/datasets/train/images/b.png",
+        "/bucket/datasets/train/labels/a.json",
+        "/bucket/datasets/train/labels/b.json",
+    ]
+
+
+def test_find_in_object_store(object_store):
+    result = find(
+        {"image": "images/{name}.png", "label": "labels/{name}.json"},
+        "/bucket/datasets/train",
+        use_relative_paths=True,
+        as_strings=True,
+        anchored=True,
+        filesystem=ObjectStoreFileSystem(object_store),
+    )
+    assert result == {
+        "a": {"image": "images/a.png", "label": "labels/a.json"},
+        "b": {"image": "images/b.png", "label": "labels/b.json"},
+    }
+    # One page for each of the two prefixes, plus one for the remaining directory marker
+    assert object_store.requests == 3
+
+
+def test_find_recursively_in_object_store(object_store):
+    result = find("**/{name}.png", "/bucket", filesystem=ObjectStoreFileSystem(object_store), as_strings=True)
+    assert result == {
+        "a": "/bucket/datasets/train/images/a.png",
+        "b": "/bucket/datasets/train/images/b.png",
+        "c": "/bucket/datasets/val/images/c.png",
+    }
+    # The whole bucket is listed at once, instead of listing each "directory"
+    assert object_store.requests == 4
+
+
+class FakeBoto3Client:
+    def __init__(self, pages):
+        self.pages = pages
+        self.arguments = None
+
+    def get_paginator(self, operation_name):
+        assert operation_name == "list_objects_v2"
+        return self
+
+    def paginate(self, **arguments):
+        self.arguments = arguments
+        return self.pages
+
+
+def test_s3_client():
+    boto3_client = FakeBoto3Client([{"Contents": [{"Key": "a/b.txt"}], "CommonPrefixes": [{"Prefix": "a/c/"}]}, {}])
+    pages = list(S3Client(boto3_client).list_objects("bucket", prefix="a/", delimiter="/"))
+    assert pages == [(["a/b.txt"], ["a/c/"]), ([], [])]
+    assert boto3_client.arguments == {"Bucket": "bucket", "Prefix": "a/", "Delimiter": "/"}
@@ -0,0 +1,56 @@
+import pytest
+
+from grob.core.ignore_rules import IgnoreRules, parse_rule
+
+
+@pytest.mark.parametrize(
+    "rules, path, is_dir, expected_result",
+    [
+        pytest.param(["*.tmp"], "a.tmp", False, True),
+        pytest.param(["*.tmp"], "a/b/c.tmp", False, True),
+        pytest.param(["*.tmp"], "a/b/c.tmp.txt", False, False),
+        pytest.param([".git/"], ".git", True, True),
+        pytest.param([".git/"], "a/.git", True, True),
+        pytest.param([".git/"], ".git", False, False),
+        pytest.param(["/build"], "build", True, True),
+        pytest.param(["/build"], "a/build", True, False),
+        pytest.param(["data/tmp"], "data/tmp", True, True),
+        pytest.param(["data/tmp"], "a/data/tmp", True, False),
+        pytest.param(["**/tmp"], "a/b/tmp", True, True),
+        pytest.param(["data/**/tmp"], "data/tmp", True, True),
+        pytest.param(["data/**/tmp"], "data/a/b/tmp", True, True),
+        pytest.param(["data/**"], "data/a/b.txt", False, True),
+        pytest.param(["file_?.txt"], "file_1.txt", False, True),
+        pytest.param(["file_?.txt"], "file_12.txt", False, False),
+        pytest.param(["file_[0-4].txt"], "file_3.txt", False, True),
+        pytest.param(["file_[!0-4].txt"], "file_3.txt", False, False),
+        pytest.param(["*.txt", "!keep.txt"], "keep.txt", False, False),
+        pytest.param(["*.txt", "!keep.txt"], "other.txt", False, True),
+        pytest.param(["# comment", ""], "# comment", False, False),
+        pytest.param(["\\#file"], "#file", False, True),
+    ],
+)
+def test_ignore_rules(rules, path, is_dir, expected_result):
+    ignore_rules = IgnoreRules([parse_rule(rule) for rule in rules if parse_rule(rule) is not None])
+    assert ignore_rules.is_ignored(path, is_dir=is_dir) is expected_result
+
+
+@pytest.mark.parametrize(
+    "path, expected_result",
+    [
+        pytest.param(".hidden", True),
+        pytest.param("a/.hidden", True),
+        pytest.param("a/visible", False),
+        pytest.param(".a/visible", False),
+    ],
+)
+def test_skip_hidden(path, expected_result):
+    assert IgnoreRules(skip_hidden=True).is_ignored(path, is_dir=False) is expected_result
+
+
+def test_ignore_rules_from_options(tmp_path):
+    ignore_file = tmp_path / ".gitignore"
+    ignore_file.write_text("# Temporary files\n*.tmp\n\n__pycache__/\n")
+    ignore_rules = IgnoreRules.from_options(exclude=[".git/"], ignore_files=[ignore_file])
+    assert len(ignore_rules.rules) == 3
+    assert IgnoreRules.from_options() is None
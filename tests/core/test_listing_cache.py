@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from grob.core import listing_cache
+from grob.core.listing_cache import ListingCache
+from grob.core.walker import walk
+
+
+@pytest.fixture
+def root_dir(tmp_path):
+    root_dir = tmp_path / "root"
+    for file in ["a/b/c.txt", "a/d.txt", "e.txt"]:
+        path = root_dir / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    yield root_dir
+
+
+@pytest.fixture(autouse=True)
+def no_racy_delay(monkeypatch):
+    monkeypatch.setattr(listing_cache, "RACY_DELAY_NS", -1)
+
+
+def _walk_with_cache(cache_dir, root_dir):
+    cache = ListingCache(cache_dir, root_dir=root_dir)
+    files = sorted(walk(root_dir, lister=cache.list_dir))
+    cache.save()
+    return files, cache
+
+
+def test_listing_cache_reuses_unchanged_directories(tmp_path, root_dir):
+    files, cache = _walk_with_cache(tmp_path / "cache", root_dir)
+    assert (cache.hits, cache.misses) == (0, 3)
+    cached_files, cache = _walk_with_cache(tmp_path / "cache", root_dir)
+    assert (cache.hits, cache.misses) == (3, 0)
+    assert cached_files == files
+
+
+def test_listing_cache_relists_modified_directories(tmp_path, root_dir):
+    _walk_with_cache(tmp_path / "cache", root_dir)
+    (root_dir / "a/b/f.txt").touch()
+    # Ensure the modification time changes, even on filesystems with a coarse resolution
+    stat = os.stat(root_dir / "a/b")
+    os.utime(root_dir / "a/b", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    files, cache = _walk_with_cache(tmp_path / "cache", root_dir)
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert root_dir / "a/b/f.txt" in files
+
+
+def test_listing_cache_ignores_recently_modified_directories(tmp_path, root_dir, monkeypatch):
+    monkeypatch.setattr(listing_cache, "RACY_DELAY_NS", 3600 * 1_000_000_000)
+    _walk_with_cache(tmp_path / "cache", root_dir)
+    _, cache = _walk_with_cache(tmp_path / "cache", root_dir)
+    assert cache.hits == 0
+
+
+def test_listing_cache_with_corrupted_file(tmp_path, root_dir):
+    _, cache = _walk_with_cache(tmp_path / "cache", root_dir)
+    cache.cache_file.write_text("{not json")
+    files, cache = _walk_with_cache(tmp_path / "cache", root_dir)
+    assert len(files) == 3
+    assert cache.misses == 3
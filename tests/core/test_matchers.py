@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from grob.core.matchers import TagMatcher
+from grob.core.tags import create_tags
+
+PATHS = [
+    "/root/images/a.png",
+    "/root/images/a.small.png",
+    "/root/labels/a.json",
+    "/root/labels/sub/a.json",
+    "/root/a/b/c/d.txt",
+    "/root/readme.md",
+    "/root/run12.txt",
+    "/root/images/with\nnewline.png",
+]
+
+
+def match_sequentially(tags, path):
+    for index, tag in enumerate(tags):
+        key = tag.parser(path)
+        if key is not None:
+            return index, key
+    return None
+
+
+@pytest.mark.parametrize(
+    "spec, anchor",
+    [
+        ({"image": "images/{name}.png", "label": "labels/{name}.json"}, None),
+        ({"image": "images/{name}.png", "label": "labels/{name}.json"}, "/root"),
+        # A later tag matching earlier in the path must not win over the first tag
+        ({"txt": "{last}.txt", "nested": "{first}/**/*"}, None),
+        ({"small": "{name}.small.{ext}", "any": "{name}.{ext}", "other": "*"}, None),
+        ({"optional": "{parent}/{name}{suffix:d}?.png", "regex": r"(?P<name>\w+)\.json:r", "any": "**/{name}.*"}, None),
+        (
+            {"deep": "**/{deep:d}.txt", "number": "{number:d}.txt", "suffix": "*{suffix:d}.txt", "name": "{name}.txt"},
+            None,
+        ),
+        ({"images": "images/{name}.png", "callable": lambda path: path.stem, "labels": "**/{name}.json"}, None),
+    ],
+)
+def test_tag_matcher(spec, anchor):
+    tags = create_tags(spec, anchor=anchor)
+    match_tag = TagMatcher(tags)
+    for path in PATHS:
+        assert match_tag(path) == match_sequentially(tags, path)
+        assert match_tag(Path(path)) == match_sequentially(tags, Path(path))
+
+
+@pytest.mark.parametrize("anchor", [None, "/root"])
+def test_tag_matcher_with_many_tags(anchor):
+    spec = {
+        # Tags that can match any path must still win if they come first
+        "first": "sensor_00/*.bin",
+        "callable": lambda path: path.stem if path.stem == "special" else None,
+        **{f"sensor_{i:02d}": f"{{split}}/sensor_{i:02d}/{{frame}}.bin" for i in range(40)},
+        "json": "**/{name}.json",
+        "any": "**/{name}",
+    }
+    tags = create_tags(spec, anchor=anchor)
+    match_tag = TagMatcher(tags)
+    paths = [
+        f"/root/{split}/{sensor_dir}/{name}"
+        for split in ["train", "test"]
+        for sensor_dir in ["sensor_00", "sensor_07", "my_sensor_07", "sensor_39", "other"]
+        for name in ["a.bin", "special.bin", "b.json", "c.txt", "d.bin\n"]
+    ]
+    for path in paths:
+        assert match_tag(path) == match_sequentially(tags, path)
+    # Only a few tags must be tried for each path
+    assert match_tag._index.candidates("/root/train/sensor_07/a.bin") == (1, 9, 43)
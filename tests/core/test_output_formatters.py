@@ -58,6 +58,20 @@ def test_format_groups_with_relative_paths(groups, tmp_path):
     }
 
 
+def test_format_groups_with_string_paths(tmp_path):
+    groups = {GroupKey("k1"): {T1: str(tmp_path / "a" / "k1_t1"), T2: [str(tmp_path / "k1_t2"), str(tmp_path / "k0")]}}
+    groups = format_groups(groups=groups, tag_names=[T1, T2], relative_to=tmp_path)
+    assert groups == {"k1": {"T1": "a/k1_t1", "T2": ["k0", "k1_t2"]}}
+
+
+def test_format_groups_relative_to_several_roots(tmp_path):
+    groups = {
+        GroupKey("k1"): {T1: tmp_path / "a" / "k1_t1", T2: [tmp_path / "a" / "b" / "k1_t2", tmp_path / "k1_t2"]},
+    }
+    groups = format_groups(groups=groups, tag_names=[T1, T2], relative_to=[tmp_path, tmp_path / "a" / "b"])
+    assert groups == {"k1": {"T1": Path("a/k1_t1"), "T2": [Path("k1_t2"), Path("k1_t2")]}}
+
+
 def test_format_groups_with_single_tag_and_squeeze(groups_with_single_tag, tmp_path):
     groups = format_groups(groups=groups_with_single_tag, tag_names=[T1])
     assert groups == {
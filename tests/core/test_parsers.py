@@ -1,6 +1,6 @@
 import pytest
 
-from grob.core.parsers import PatternParser
+from grob.core.parsers import LiteralFilter, PatternParser
 
 
 @pytest.mark.parametrize(
@@ -45,6 +45,8 @@ from grob.core.parsers import PatternParser
 def test_path_parser(pattern, path, expected_result):
     parser = PatternParser(pattern)
     assert parser(path) == expected_result
+    # The literal filter must never reject a matching path
+    assert parser.literal_filter(path) or expected_result is None
 
 
 @pytest.mark.parametrize(
@@ -66,3 +68,66 @@ def test_path_parser(pattern, path, expected_result):
 def test_path_parser_key_parts(pattern, expected_parts):
     parser = PatternParser(pattern)
     assert parser.key_parts == expected_parts
+
+
+@pytest.mark.parametrize(
+    "pattern, path, expected_result",
+    [
+        pytest.param("{name}.txt", "/root/foo.txt", {"name": "foo"}),
+        pytest.param("{name}.txt", "/root/bar/foo.txt", None),
+        pytest.param("bar/{name}.txt", "/root/bar/foo.txt", {"name": "foo"}),
+        pytest.param("bar/{name}.txt", "/root/baz/bar/foo.txt", None),
+        pytest.param("**/{name}.txt", "/root/baz/bar/foo.txt", {"name": "foo"}),
+        pytest.param("{name}.txt", "/other/foo.txt", None),
+    ],
+)
+def test_anchored_path_parser(pattern, path, expected_result):
+    parser = PatternParser(pattern, anchor="/root")
+    assert parser(path) == expected_result
+
+
+@pytest.mark.parametrize(
+    "pattern, anchor, expected_filter",
+    [
+        pytest.param("*", None, LiteralFilter()),
+        pytest.param("*.png", None, LiteralFilter(suffixes=(".png", ".png\n"))),
+        pytest.param("{name}.(jpg|png)", None, LiteralFilter(substrings=(".",))),
+        pytest.param(
+            "labels_{id}.json", None, LiteralFilter(suffixes=(".json", ".json\n"), substrings=("labels_",))
+        ),
+        pytest.param(
+            "foo/**/bar_{index}.txt",
+            None,
+            LiteralFilter(suffixes=(".txt", ".txt\n"), substrings=("foo", "bar_"), min_separators=0),
+        ),
+        pytest.param(
+            "{split}/images/{name}",
+            None,
+            LiteralFilter(substrings=("/images/",), min_separators=2),
+        ),
+        pytest.param(
+            "images/{name}.png",
+            "/root/",
+            LiteralFilter(prefix="/root/images/", suffixes=(".png", ".png\n"), min_separators=3),
+        ),
+        pytest.param(r"\{not a placeholder\}.txt", None, LiteralFilter(suffixes=(".txt", ".txt\n"))),
+    ],
+)
+def test_literal_filter(pattern, anchor, expected_filter):
+    assert LiteralFilter.from_pattern(pattern, anchor=anchor) == expected_filter
+
+
+@pytest.mark.parametrize(
+    "path, expected_result",
+    [
+        pytest.param("/root/train/images/a.png", True),
+        pytest.param("/root/train/images/a.png\n", True),
+        pytest.param("/root/train/images/a.jpg", False),
+        pytest.param("/root/train/labels/a.png", False),
+        pytest.param("/root/images/a.png", False),
+        pytest.param("/other/train/images/a.png", False),
+    ],
+)
+def test_literal_filter_call(path, expected_result):
+    literal_filter = LiteralFilter.from_pattern("{split}/images/{name}.png", anchor="/root")
+    assert literal_filter(path) == expected_result
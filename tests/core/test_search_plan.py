@@ -0,0 +1,39 @@
+import pytest
+
+from grob.core.search_plan import SearchPlan, create_search_plan
+from grob.core.tags import create_tags
+
+
+@pytest.mark.parametrize(
+    "patterns, expected_start_dirs",
+    [
+        pytest.param("*.png", {(): 0}),
+        pytest.param("images/{name}.png", {("images",): 0}),
+        pytest.param("{subset}/images/{name}.png", {(): 2}),
+        pytest.param("images/**/{name}.png", {("images",): None}),
+        pytest.param("**/{name}.png", {(): None}),
+        pytest.param("(train|val)/images/*.png", {("train", "images"): 0, ("val", "images"): 0}),
+        pytest.param("data_(a|b)/*/*.png", {("data_a",): 1, ("data_b",): 1}),
+        pytest.param({"image": "images/{name}.png", "label": "labels/{name}.json"}, {("images",): 0, ("labels",): 0}),
+        pytest.param({"image": "a/b/{name}.png", "label": "a/{name}.json"}, {("a",): 1}),
+        pytest.param({"image": "a/b/**/{name}.png", "label": "a/{name}.json"}, {("a",): None}),
+        pytest.param({"image": "a/{x}/{name}.png", "label": "a/b/c/d/{name}.json"}, {("a",): 3}),
+        pytest.param({"image": "{x}/{name}.png", "label": "a/{name}.json"}, {(): 1}),
+    ],
+)
+def test_create_search_plan(patterns, expected_start_dirs):
+    tags = create_tags(patterns, anchor="/root")
+    assert create_search_plan(tags) == SearchPlan(start_dirs=expected_start_dirs)
+
+
+@pytest.mark.parametrize(
+    "patterns, anchor",
+    [
+        pytest.param("images/{name}.png", None),
+        pytest.param("images/(?P<name>.*).png:r", "/root"),
+        pytest.param({"image": "images/{name}.png", "label": lambda path: path.stem}, "/root"),
+    ],
+)
+def test_create_full_search_plan(patterns, anchor):
+    tags = create_tags(patterns, anchor=anchor)
+    assert create_search_plan(tags).is_full
@@ -0,0 +1,55 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from grob.core.errors import InvalidManifestError
+from grob.core.sources import read_manifest, read_path_list
+
+
+@pytest.mark.parametrize(
+    "content, separator, expected",
+    [
+        ("a.txt\nb/c.txt\n", "\n", ["a.txt", "b/c.txt"]),
+        ("a.txt\r\nb/c.txt", "\n", ["a.txt", "b/c.txt"]),
+        ("a.txt\n\nb.txt\n", "\n", ["a.txt", "b.txt"]),
+        ("a.txt\0b/with\nnewline.txt\0", "\0", ["a.txt", "b/with\nnewline.txt"]),
+        ("a.txt\0b.txt", "\0", ["a.txt", "b.txt"]),
+        ("", "\0", []),
+    ],
+)
+def test_read_path_list(content, separator, expected):
+    assert list(read_path_list(io.StringIO(content), separator=separator)) == expected
+
+
+def test_read_csv_manifest(tmp_path):
+    manifest = tmp_path / "inventory.csv"
+    manifest.write_text("size,path\n12,a.txt\n3,b/c.txt\n")
+    assert list(read_manifest(manifest)) == ["a.txt", "b/c.txt"]
+
+
+def test_read_headerless_csv_manifest(tmp_path):
+    manifest = tmp_path / "inventory.csv.gz"
+    with gzip.open(manifest, "wt") as stream:
+        stream.write('"bucket","a.txt"\n"bucket","b/c.txt"\n')
+    assert list(read_manifest(manifest, column=1)) == ["a.txt", "b/c.txt"]
+
+
+def test_read_tsv_manifest(tmp_path):
+    manifest = tmp_path / "inventory.tsv"
+    manifest.write_text("key\tsize\na.txt\t12\n")
+    assert list(read_manifest(manifest, column="key")) == ["a.txt"]
+
+
+def test_read_jsonl_manifest(tmp_path):
+    manifest = tmp_path / "inventory.jsonl"
+    manifest.write_text("\n".join(json.dumps({"key": key, "size": 1}) for key in ["a.txt", "b/c.txt"]) + "\n")
+    assert list(read_manifest(manifest, column="key")) == ["a.txt", "b/c.txt"]
+
+
+def test_read_manifest_with_unknown_format(tmp_path):
+    manifest = tmp_path / "inventory.parquet"
+    manifest.write_bytes(b"")
+    with pytest.raises(InvalidManifestError):
+        list(read_manifest(manifest))
@@ -74,3 +74,11 @@ def test_create_tag_with_multipart_callable():
 
 
 # TODO: test failure paths
+
+
+def test_create_tag_with_root(tmp_path):
+    tag1, tag2 = create_tags({"t1": "{name}.png", "t2": {"spec": "{name}.json", "root": tmp_path}}, anchor="/data")
+    assert tag1.root is None
+    assert tag1.parser.anchor == "/data"
+    assert tag2.root == tmp_path.resolve()
+    assert tag2.parser.anchor == tmp_path.resolve().as_posix()
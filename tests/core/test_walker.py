@@ -1,6 +1,10 @@
+import os
+
 import pytest
 
-from grob.core.walker import walk
+from grob.core.ignore_rules import IgnoreRules
+from grob.core.search_plan import SearchPlan
+from grob.core.walker import list_dir, walk
 
 
 @pytest.fixture
@@ -32,3 +36,95 @@ def test_walk(populated_directory):
             populated_directory / "a/b/c.txt",
         ]
     )
+
+
+def test_walk_as_strings(populated_directory):
+    files = list(walk(populated_directory, as_strings=True))
+    assert all(isinstance(file, str) for file in files)
+    assert files == [str(file) for file in walk(populated_directory)]
+
+
+@pytest.mark.parametrize(
+    "start_dirs, expected_files",
+    [
+        pytest.param({(): 0}, ["a.txt"]),
+        pytest.param({(): 1}, ["a.txt", "a/b.txt"]),
+        pytest.param({("a",): 1}, ["a/b.txt", "a/b/c.txt", "a/b/e.txt"]),
+        pytest.param({("a", "b", "c"): None}, ["a/b/c/e.txt", "a/b/c/f.txt"]),
+        pytest.param({("a", "b", "c"): 0, ("d",): None}, ["a/b/c/e.txt", "a/b/c/f.txt"]),
+    ],
+)
+def test_walk_with_search_plan(populated_directory, start_dirs, expected_files):
+    files = list(walk(populated_directory, search_plan=SearchPlan(start_dirs=start_dirs)))
+    assert sorted(files) == sorted(populated_directory / file for file in expected_files)
+
+
+def test_walk_doesnt_follow_symlinks(populated_directory, tmp_path_factory):
+    other_dir = tmp_path_factory.mktemp("other")
+    (other_dir / "g.txt").touch()
+    (populated_directory / "a/link").symlink_to(other_dir, target_is_directory=True)
+    (populated_directory / "a/file_link.txt").symlink_to(populated_directory / "a.txt")
+    files = list(walk(populated_directory))
+    assert populated_directory / "a/file_link.txt" in files
+    assert not any(file.name == "g.txt" or file.name == "link" for file in files)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_walk_follows_symlinks(populated_directory, tmp_path_factory, workers):
+    other_dir = tmp_path_factory.mktemp("other")
+    (other_dir / "g.txt").touch()
+    (populated_directory / "a/link").symlink_to(other_dir, target_is_directory=True)
+    (populated_directory / "a/other_link").symlink_to(other_dir, target_is_directory=True)
+    # Loop back to the root directory
+    (populated_directory / "a/b/loop").symlink_to(populated_directory, target_is_directory=True)
+    files = list(walk(populated_directory, follow_symlinks=True, workers=workers))
+    assert len(files) == len(set(files)) == 7
+    # The other directory is only walked through one of the links
+    assert sum(file.name == "g.txt" for file in files) == 1
+
+
+def test_walk_skips_duplicate_files(populated_directory):
+    os.link(populated_directory / "a.txt", populated_directory / "a/hard_link.txt")
+    (populated_directory / "a/b/symbolic_link.txt").symlink_to(populated_directory / "a.txt")
+    all_files = list(walk(populated_directory))
+    files = list(walk(populated_directory, skip_duplicate_files=True))
+    assert len(all_files) == 8
+    assert files == [file for file in all_files if file.name not in {"hard_link.txt", "symbolic_link.txt"}]
+
+
+@pytest.mark.parametrize("workers", [2, 8])
+@pytest.mark.parametrize(
+    "start_dirs",
+    [
+        pytest.param({(): None}),
+        pytest.param({(): 1}),
+        pytest.param({("a",): None, ("b",): 0}),
+    ],
+)
+def test_walk_concurrently(populated_directory, workers, start_dirs):
+    search_plan = SearchPlan(start_dirs=start_dirs)
+    expected_files = list(walk(populated_directory, search_plan=search_plan))
+    files = list(walk(populated_directory, search_plan=search_plan, workers=workers))
+    # Order must be the same as with a sequential walk
+    assert files == expected_files
+
+
+def test_walk_with_ignore_rules(populated_directory):
+    listed_dirs = []
+
+    def spy_lister(dir_path):
+        listed_dirs.append(dir_path)
+        return list_dir(dir_path)
+
+    ignore_rules = IgnoreRules.from_options(exclude=["c/", "/a/b.txt"])
+    files = list(walk(populated_directory, lister=spy_lister, ignore_rules=ignore_rules))
+    assert sorted(files) == sorted(populated_directory / file for file in ["a/b/e.txt", "a.txt", "a/b/c.txt"])
+    # Excluded directories must not be listed at all
+    assert (populated_directory / "a/b/c").as_posix() not in listed_dirs
+
+
+def test_walk_with_ignored_start_dir(populated_directory):
+    ignore_rules = IgnoreRules.from_options(exclude=["/a/b"])
+    search_plan = SearchPlan(start_dirs={("a", "b", "c"): None, (): 0})
+    files = list(walk(populated_directory, search_plan=search_plan, ignore_rules=ignore_rules))
+    assert files == [populated_directory / "a.txt"]
@@ -0,0 +1,49 @@
+import shutil
+from itertools import islice
+from pathlib import Path
+
+import pytest
+
+from grob.core.watcher import GroupEvent, watch
+
+SPEC = {"image": "{name}.png", "label": "{name}.json"}
+
+
+@pytest.fixture
+def root_dir(tmp_path):
+    for file in ["a.png", "a.json", "b.png"]:
+        (tmp_path / file).touch()
+    yield tmp_path
+
+
+def _next_events(events, n):
+    return list(islice(events, n))
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watch(root_dir, use_inotify):
+    events = watch(SPEC, root_dir, use_relative_paths=True, poll_interval=0.05, use_inotify=use_inotify)
+    group_a = {"image": Path("a.png"), "label": Path("a.json")}
+    assert _next_events(events, 1) == [GroupEvent("added", "a", group_a)]
+
+    (root_dir / "b.json").touch()
+    group_b = {"image": Path("b.png"), "label": Path("b.json")}
+    assert _next_events(events, 1) == [GroupEvent("completed", "b", group_b)]
+
+    (root_dir / "a.json").unlink()
+    assert _next_events(events, 1) == [GroupEvent("removed", "a", group_a)]
+
+    (root_dir / "sub").mkdir()
+    (root_dir / "sub/c.png").touch()
+    (root_dir / "sub/c.json").touch()
+    group_c = {"image": Path("sub/c.png"), "label": Path("sub/c.json")}
+    assert _next_events(events, 1) == [GroupEvent("added", "c", group_c)]
+
+    (root_dir / "sub/c.png").rename(root_dir / "sub/b.png")
+    (root_dir / "b.png").unlink()
+    group_b["image"] = Path("sub/b.png")
+    assert _next_events(events, 2) == [GroupEvent("changed", "b", group_b), GroupEvent("removed", "c", group_c)]
+
+    shutil.rmtree(root_dir / "sub")
+    assert _next_events(events, 1) == [GroupEvent("removed", "b", group_b)]
+    events.close()
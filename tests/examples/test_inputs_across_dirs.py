@@ -1,10 +1,13 @@
+import zipfile
 from functools import partial
+from pathlib import Path
 
 import pytest
 
-from grob.core.errors import MissingTagError
+from grob import find
+from grob.core.errors import AmbiguousTagError, MissingTagError
 
-from .conftest import run_example
+from .conftest import get_example_dir, run_example
 
 run = partial(run_example, example_name="inputs_across_dirs")
 
@@ -43,3 +46,72 @@ def test_with_specific_extensions():
         "fifi": {"image": "images/fifi.gif", "labels": "labels/fifi.json"},
         "loulou": {"image": None, "labels": "labels/loulou.json"},
     }
+
+
+def test_with_listing_cache(tmp_path):
+    options = ["--cache-dir", (tmp_path / "cache").as_posix()]
+    first_result = run("image=images/{name}.*,labels={name}.json", options=options)
+    second_result = run("image=images/{name}.*,labels={name}.json", options=options)
+    assert first_result == second_result == run("image=images/{name}.*,labels={name}.json")
+
+
+def test_from_path_list(tmp_path):
+    path_list = tmp_path / "paths.txt"
+    path_list.write_text("images/riri.jpg\nimages/fifi.gif\nlabels/riri.json\nlabels/fifi.json\n")
+    result = run("image=images/{name}.*,labels={name}.json", options=["--from-list", path_list.as_posix()])
+    assert result == {
+        "riri": {"image": "images/riri.jpg", "labels": "labels/riri.json"},
+        "fifi": {"image": "images/fifi.gif", "labels": "labels/fifi.json"},
+    }
+
+
+def test_from_manifest(tmp_path):
+    manifest = tmp_path / "inventory.csv"
+    manifest.write_text("key,size\nimages/riri.jpg,10\nlabels/riri.json,2\n")
+    options = ["--manifest", manifest.as_posix(), "--manifest-column", "key"]
+    result = run("image=images/{name}.*,labels={name}.json", options=options)
+    assert result == {"riri": {"image": "images/riri.jpg", "labels": "labels/riri.json"}}
+
+
+def test_with_several_roots():
+    root_dir = get_example_dir("inputs_across_dirs")
+    result = find(
+        {"image": "{name}.(gif|jpg|png)", "labels": "{name}.json"},
+        [root_dir / "images", root_dir / "labels"],
+        use_relative_paths=True,
+    )
+    assert result == {
+        "riri": {"image": Path("riri.jpg"), "labels": Path("riri.json")},
+        "fifi": {"image": Path("fifi.gif"), "labels": Path("fifi.json")},
+        "loulou": {"image": Path("loulou.png"), "labels": Path("loulou.json")},
+    }
+
+
+def test_with_tag_roots():
+    root_dir = get_example_dir("inputs_across_dirs")
+    options = ["--tag-root", f"labels={root_dir / 'labels'}", "--anchored"]
+    result = run("image=images/{name}.*,labels={name}.json", options=options)
+    assert result == {
+        "riri": {"image": "images/riri.jpg", "labels": "riri.json"},
+        "fifi": {"image": "images/fifi.gif", "labels": "fifi.json"},
+        "loulou": {"image": "images/loulou.png", "labels": "loulou.json"},
+    }
+
+
+def test_with_duplicate_files_across_roots():
+    root_dir = get_example_dir("inputs_across_dirs")
+    with pytest.raises(AmbiguousTagError):
+        find("{name}.json", [root_dir, root_dir / "labels"])
+
+
+def test_with_archives(tmp_path):
+    root_dir = get_example_dir("inputs_across_dirs")
+    for name in ["riri", "fifi"]:
+        with zipfile.ZipFile(tmp_path / f"{name}.zip", "w") as zip_file:
+            for path in root_dir.glob(f"*/{name}.*"):
+                zip_file.write(path, path.relative_to(root_dir).as_posix())
+    result = run("image=images/{name}.*,labels={name}.json", example_dir=tmp_path / "*.zip")
+    assert result == {
+        "riri": {"image": "images/riri.jpg", "labels": "labels/riri.json"},
+        "fifi": {"image": "images/fifi.gif", "labels": "labels/fifi.json"},
+    }
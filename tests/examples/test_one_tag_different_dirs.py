@@ -1,6 +1,8 @@
 from functools import partial
 
-from .conftest import run_example
+from grob import find
+
+from .conftest import get_example_dir, run_example
 
 run = partial(run_example, example_name="one_tag_different_dirs")
 
@@ -68,3 +70,46 @@ def test_with_specific_directory():
 def test_with_specific_directory_and_fixed_nesting_level():
     result = run("a/*/*_{index}.*")
     assert result == {"002": FILES[1], "003": FILES[2]}
+
+
+def test_anchored_wildcard():
+    result = run("*/*", options=["--anchored"])
+    assert result == sorted([FILES[0], *FILES[4:7], *FILES[8:]])
+
+
+def test_anchored_with_specific_directory():
+    result = run("(a|d)/**/*_{index}.(png|jpg)", options=["--anchored"])
+    assert result == {
+        "001": FILES[0],
+        "003": FILES[2],
+        "004": FILES[3],
+        "005": FILES[4],
+        "006": FILES[5],
+        "007": FILES[6],
+        "008": FILES[7],
+    }
+
+
+def test_with_concurrent_walk():
+    result = run("**/*_{index}.*", options=["--walk-workers", "4"])
+    assert result == run("**/*_{index}.*")
+
+
+
+def test_string_paths():
+    root_dir = get_example_dir("one_tag_different_dirs")
+    result = find("**/*_{index}.*", root_dir, use_relative_paths=True, as_strings=True)
+    path_result = find("**/*_{index}.*", root_dir, use_relative_paths=True)
+    assert result == {key: path.as_posix() for key, path in path_result.items()}
+    assert all(isinstance(path, str) for path in result.values())
+
+
+def test_string_paths_with_callable():
+    root_dir = get_example_dir("one_tag_different_dirs")
+    result = find(lambda path: path.stem[-3:], root_dir / "d", use_relative_paths=True, as_strings=True)
+    assert result == {
+        "005": "img_005.jpg",
+        "006": "img_006.jpg",
+        "007": "img_007.jpg",
+        "008": "e/picture_resized_008.jpg",
+    }
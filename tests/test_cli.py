@@ -74,6 +74,30 @@ from grob.cli.app import create_parser
         (". . --absolute", {"use_relative_path": False}),
         (". . --relative", {"use_relative_path": True}),
         (". .", {"use_relative_path": True}),
+        (". .", {"anchored": False}),
+        (". . --anchored", {"anchored": True}),
+        (". .", {"walk_workers": 1}),
+        (". . --walk-workers 8", {"walk_workers": 8}),
+        (". .", {"follow_symlinks": False, "skip_duplicate_files": False}),
+        (". . --follow-symlinks --skip-duplicate-files", {"follow_symlinks": True, "skip_duplicate_files": True}),
+        (". .", {"exclude": [], "ignore_files": [], "skip_hidden": False}),
+        (". . --exclude .git/ --exclude *.tmp", {"exclude": [".git/", "*.tmp"]}),
+        (". . --ignore-file .gitignore", {"ignore_files": [Path(".gitignore")]}),
+        (". . --skip-hidden", {"skip_hidden": True}),
+        (". .", {"watch": False}),
+        (". . --watch", {"watch": True}),
+        (". .", {"cache_dir": None}),
+        (". . --cache-dir .cache", {"cache_dir": Path(".cache")}),
+        (". .", {"from_list": None, "null": False, "manifest": None, "manifest_column": "path"}),
+        (". . --from-list -", {"from_list": "-"}),
+        (". . --from-list paths.txt --null", {"from_list": "paths.txt", "null": True}),
+        (". . --from-list paths.txt -0", {"null": True}),
+        (". . --manifest inventory.csv", {"manifest": Path("inventory.csv")}),
+        (". . --manifest-column key", {"manifest_column": "key"}),
+        (". . --manifest-column 1", {"manifest_column": 1}),
+        (". .", {"extra_roots": [], "tag_roots": []}),
+        (". a --extra-root b --extra-root c", {"root_dir": Path("a"), "extra_roots": [Path("b"), Path("c")]}),
+        (". . --tag-root labels=/mnt/labels", {"tag_roots": ["labels=/mnt/labels"]}),
     ],
 )
 def test_create_parser(args, attrs):